@@ -4,6 +4,23 @@ import yaml
 import os
 import re
 
+try:
+    # the libyaml based loaders are much faster. They are only available when PyYAML
+    # is built with libyaml.
+    from yaml import CSafeLoader as SafeLoader, CFullLoader as FullLoader
+except ImportError:
+    from yaml import SafeLoader, FullLoader
+
+
+# patterns for the referenced variables. They are compiled once instead of on every
+# call to the parse functions below.
+_DOUBLE_QUOTES_VARS = re.compile(
+    r"{{\s*([_a-zA-Z0-9.\-\$#\?]*)\s*}}", flags=re.MULTILINE
+)
+_DOUBLE_QUOTE_WORKFLOW_VARS = re.compile(
+    r"{{\s*(workflow\.[_a-zA-Z0-9.\-\$#\?]*)\s*}}", flags=re.MULTILINE
+)
+
 
 def _check_list(lst: list, folder: str):
     """Recursive function to handle import_from inside nested lists."""
@@ -72,7 +89,7 @@ def parse_file(input_file: str) -> dict:
             data = json.load(inf)
     else:
         with open(input_file) as inf:
-            data = yaml.safe_load(inf.read())
+            data = yaml.load(inf, SafeLoader)
 
     # populate full dictionary
     folder = os.path.dirname(input_file)
@@ -91,9 +108,10 @@ def parse_double_quotes_vars(input: str) -> list:
     Returns:
         list -- A list of matched substrings (empty list if None)
     """
-    pattern = r"{{\s*([_a-zA-Z0-9.\-\$#\?]*)\s*}}"
-    match = re.findall(pattern, input, flags=re.MULTILINE)
-    return match
+    if '{{' not in input:
+        # most values do not reference any variables
+        return []
+    return _DOUBLE_QUOTES_VARS.findall(input)
 
 
 def parse_double_quote_workflow_vars(input: str) -> list:
@@ -105,9 +123,7 @@ def parse_double_quote_workflow_vars(input: str) -> list:
     Returns:
         list -- A list of matched substrings (empty list if None)
     """
-    pattern = r"{{\s*(workflow\.[_a-zA-Z0-9.\-\$#\?]*)\s*}}"
-    match = re.findall(pattern, input, flags=re.MULTILINE)
-    return match
+    return _DOUBLE_QUOTE_WORKFLOW_VARS.findall(input)
 
 
 def replace_double_quote_vars(text: str, key: str, replace: str) -> str:
@@ -1,11 +1,21 @@
 """A collection of methods to handle queenbee referenced variables."""
-from typing import Union
+import functools
+from typing import Tuple, Union
 from .parser import parse_double_quotes_vars
 
 
+@functools.lru_cache(maxsize=4096)
+def _ref_variables(value: Union[bytes, str]) -> Tuple[str]:
+    """Parse referenced variables once for each distinct value."""
+    return tuple(parse_double_quotes_vars(value))
+
+
 def get_ref_variable(value: Union[bytes, str]) -> list:
     """Get referenced variable if any
 
+    The same strings are parsed many times when recipes are loaded. The parsed
+    variables are cached and a new list is returned for each call.
+
     Arguments:
         value {Union[bytes, str]} -- input to parse double quoted variables
             ("{{some.double.quoted.var}}") from.
@@ -13,12 +23,16 @@ def get_ref_variable(value: Union[bytes, str]) -> list:
     Returns:
         list -- A list of matched substrings (empty list if None)
     """
-    return parse_double_quotes_vars(value)
+    return list(_ref_variables(value))
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_inputs_outputs_var_format(value: str) -> str:
     """Validate inputs/outputs variables
 
+    The same variables are referenced in many places. The validation message is
+    cached for each distinct variable.
+
     Arguments:
         value {str} -- A '.' seperated string to be checked for inputs/outputs variable
             formatting
@@ -34,3 +48,22 @@ def validate_inputs_outputs_var_format(value: str) -> str:
     elif len(parts) != 2:
         add_info = 'Inputs and outputs variables must have 2 segments.'
     return add_info
+
+
+@functools.lru_cache(maxsize=4096)
+def validate_ref_variables(value: Union[bytes, str]) -> Tuple[str]:
+    """Validate the inputs/outputs variables referenced in a value.
+
+    Default values are usually the same across many inputs and recipes. The validation
+    messages are cached for each distinct value.
+
+    Arguments:
+        value {Union[bytes, str]} -- input to parse double quoted variables
+            ("{{some.double.quoted.var}}") from.
+
+    Returns:
+        Tuple[str] -- A validation message for each referenced variable.
+    """
+    return tuple(
+        validate_inputs_outputs_var_format(ref) for ref in _ref_variables(value)
+    )
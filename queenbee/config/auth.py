@@ -1,13 +1,9 @@
-import json
 from enum import Enum
-from urllib import request
-from urllib.error import HTTPError
-from typing import Union, Dict
+from typing import Dict
 from pydantic import Field, SecretStr, constr
 
 
 from ..base.basemodel import BaseModel
-from ..base.request import make_request, USER_AGENT_STRING
 
 
 class BaseAuth(BaseModel):
@@ -1,10 +1,19 @@
 """common objects between different IO files."""
 import collections
+import copy
+import functools
+import json
+import os
+import re
 
 from enum import Enum
-from typing import Dict, List, Any
+from typing import Any, ClassVar, Dict, List, Optional, Pattern, Tuple, Type
 
-from pydantic import constr, Field, validator
+from pydantic import Field, validator, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import ModelField
+from pydantic.typing import Literal
 
 from .reference import FolderReference, FileReference, references_from_string
 from ..base.basemodel import BaseModel
@@ -25,10 +34,52 @@ class ItemType(str, Enum):
     JSONObject = 'JSONObject'
 
 
+# JSON Schema for the items of an array for each item type. These are shared between all
+# the array inputs and must not be mutated.
+ITEM_TYPE_SCHEMAS = {
+    ItemType.Generic: {},
+    ItemType.String: {'type': 'string'},
+    ItemType.Integer: {'type': 'integer'},
+    ItemType.Number: {'type': 'number'},
+    ItemType.Boolean: {'type': 'boolean'},
+    ItemType.Array: {'type': 'array'},
+    ItemType.JSONObject: {'type': 'object'}
+}
+
+
+def typed_items_schema(items: Any, items_type: ItemType) -> Any:
+    """Get the items schema of an array spec with the schema for the item type.
+
+    An items schema from the user is kept and combined with the schema for the item
+    type so both of them are enforced.
+
+    Arguments:
+        items {Any} -- The items schema in the user spec or None if there is none.
+        items_type {ItemType} -- Type of the items in the array.
+
+    Returns:
+        Any -- The items schema to use for validating the array.
+    """
+    item_schema = ITEM_TYPE_SCHEMAS[items_type]
+    if items is None:
+        return item_schema
+    if not item_schema:
+        return items
+    if isinstance(items, list):
+        # a schema for each position in the array
+        return [{'allOf': [item, item_schema]} for item in items]
+    return {'allOf': [items, item_schema]}
+
+
+# types of default values that can reference other variables. The tuple is built once
+# instead of in every call to the default value validators.
+STRING_TYPES = (str, bytes)
+
+
 class GenericInput(BaseModel):
     """Base class for all input types."""
 
-    type: constr(regex='^GenericInput$') = 'GenericInput'
+    type: Literal['GenericInput'] = 'GenericInput'
 
     name: str = Field(
         ...,
@@ -50,14 +101,62 @@ class GenericInput(BaseModel):
         """
         return self._referenced_values(['default'])
 
-    @property
-    def is_artifact(self):
-        return False
+    # artifact inputs (files, folders and paths) set this to True. It is a class
+    # attribute because the kind of an input never changes for a class.
+    is_artifact: ClassVar[bool] = False
 
     @property
     def is_parameter(self):
         return not self.is_artifact
 
+    class Config:
+        # inputs and outputs are not copied when they are nested in a function, DAG or
+        # recipe. The parent keeps a reference to the same object that was passed in,
+        # so changing the input afterwards also changes it in the parent. Use copy to
+        # get an independent input.
+        copy_on_model_validation = 'none'
+
+
+class SpecValidationMixin:
+    """Validate input values against the JSON Schema specification of an input.
+
+    The classes that use this mixin must have a ``spec`` field.
+    """
+
+    # JSON Schema type that is enforced on top of spec in validate_spec. Subclasses set
+    # this to the JSON type of their values. Generic inputs do not enforce a type.
+    _json_type: ClassVar[str] = None
+
+    def _build_typed_spec(self) -> Dict:
+        """Get a copy of spec with the JSON type of this input."""
+        spec = dict(self.spec)
+        if self._json_type is not None:
+            spec['type'] = self._json_type
+        return spec
+
+    def compile_spec(self):
+        """Compile the JSON Schema validator for spec with the JSON type of this input.
+
+        Compiled validators are cached for each distinct specification so the same
+        specification is only compiled once. The validator is looked up on every call
+        so changes to spec are always used.
+
+        Returns:
+            A jsonschema validator or None if the input has no spec.
+        """
+        if not self.spec:
+            return None
+        return compile_json_schema(self._build_typed_spec())
+
+    def validate_spec(self, value):
+        """Validate an input value against specification.
+
+        Use this for validating workflow inputs against a recipe.
+        """
+        if self.spec:
+            compiled_json_schema_validator(value, self.compile_spec())
+        return value
+
 
 class GenericOutput(BaseModel):
     """Base class for all output types.
@@ -65,7 +164,7 @@ class GenericOutput(BaseModel):
     The baseclass uses a name to source the output.
     """
 
-    type: constr(regex='^GenericOutput$') = 'GenericOutput'
+    type: Literal['GenericOutput'] = 'GenericOutput'
 
     name: str = Field(
         ...,
@@ -77,14 +176,17 @@ class GenericOutput(BaseModel):
         description='Optional description for output.'
     )
 
-    @property
-    def is_artifact(self):
-        return False
+    # see GenericInput.is_artifact
+    is_artifact: ClassVar[bool] = False
 
     @property
     def is_parameter(self):
         return not self.is_artifact
 
+    class Config:
+        # see GenericInput.Config
+        copy_on_model_validation = 'none'
+
 
 class PathOutput(GenericOutput):
     """Base class for output classes that source tha output from a path.
@@ -92,7 +194,7 @@ class PathOutput(GenericOutput):
     An example of using PathOutput is TaskFile and TaskFolder outputs.
     """
 
-    type: constr(regex='^PathOutput$') = 'PathOutput'
+    type: Literal['PathOutput'] = 'PathOutput'
 
     path: str = Field(
         ...,
@@ -126,7 +228,7 @@ class FromOutput(GenericOutput):
 
     See DAG output classes for more examples.
     """
-    type: constr(regex='^FromOutput$') = 'FromOutput'
+    type: Literal['FromOutput'] = 'FromOutput'
 
     # This will be overwritten in all the subclasses.
     # We need this here to make sure the validator doesn't fail.
@@ -150,6 +252,221 @@ class FromOutput(GenericOutput):
         return v
 
 
+def _compile_json_schema(schema: Dict):
+    """Check a JSON Schema specification and compile a validator for it."""
+    from jsonschema.validators import validator_for
+    validator_class = validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+@functools.lru_cache(maxsize=256)
+def _compiled_json_schema(spec: str):
+    """Get a compiled JSON Schema validator for a JSON serialized specification.
+
+    Checking and compiling a schema is much slower than validating a value against it.
+    Validators are cached so the same specification is only compiled once.
+    """
+    return _compile_json_schema(json.loads(spec))
+
+
+def compile_json_schema(spec: Dict):
+    """Get a compiled JSON Schema validator for a specification.
+
+    jsonschema is only imported the first time a specification is compiled. Importing
+    it is relatively slow and most of the commands never validate an input value.
+
+    Arguments:
+        spec {Dict} -- A JSON Schema specification.
+
+    Returns:
+        A jsonschema validator. Pass it to ``compiled_json_schema_validator``.
+    """
+    try:
+        key = json.dumps(spec, sort_keys=True)
+    except (TypeError, ValueError):
+        # the spec cannot be serialized to a cache key. For instance it has keys of
+        # different types or values that are not JSON types.
+        return _compile_json_schema(spec)
+    return _compiled_json_schema(key)
+
+
+def compiled_json_schema_validator(value: Any, validator) -> None:
+    """Validate a value against a compiled JSON Schema validator.
+
+    Arguments:
+        value {Any} -- The value to be validated.
+        validator -- A validator from ``compile_json_schema``.
+
+    Raises:
+        ValidationError: The value is not valid against the specification.
+    """
+    from jsonschema.exceptions import best_match
+    error = best_match(validator.iter_errors(value))
+    if error is not None:
+        raise error
+
+
+def json_schema_validator(value: Any, spec: Dict) -> None:
+    """Validate a value against a JSON Schema specification.
+
+    Arguments:
+        value {Any} -- The value to be validated.
+        spec {Dict} -- A JSON Schema specification.
+
+    Raises:
+        ValidationError: The value is not valid against the specification.
+    """
+    compiled_json_schema_validator(value, compile_json_schema(spec))
+
+
+def path_mode(path: str) -> int:
+    """Get the file mode bits for a path with a single stat call.
+
+    Use ``stat.S_ISREG`` and ``stat.S_ISDIR`` to check the returned mode. Like
+    ``os.path.isfile`` and ``os.path.isdir`` a path that cannot be accessed is not an
+    error.
+
+    Arguments:
+        path {str} -- Path to a file or a folder.
+
+    Returns:
+        int -- The st_mode of the path or 0 if the path cannot be accessed.
+    """
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return 0
+
+
+@functools.lru_cache(maxsize=128)
+def compile_extensions(extensions: Tuple[str]) -> Pattern:
+    """Compile a case-insensitive pattern that matches any of the extensions.
+
+    The pattern is anchored to the end of the string so a path can be checked against
+    all the extensions with a single search. Patterns are cached for each distinct
+    tuple of extensions.
+
+    Arguments:
+        extensions {Tuple[str]} -- A tuple of file extensions (e.g. ``('epw', 'wea')``).
+
+    Returns:
+        Pattern -- A compiled pattern to search file paths with.
+    """
+    alternatives = '|'.join(re.escape(ext) for ext in extensions)
+    return re.compile(f'(?:{alternatives})\\Z', re.IGNORECASE)
+
+
+def validate_path_extensions(
+    pattern: Optional[Pattern], value: str, extensions: List[str]
+) -> None:
+    """Check that a file path ends with one of the extensions of an input.
+
+    Arguments:
+        pattern {Optional[Pattern]} -- A pattern from ``compile_extensions``. None means
+            any extension is valid.
+        value {str} -- Path to a file.
+        extensions {List[str]} -- The extensions of the input. They are only used in
+            the error message.
+
+    Raises:
+        AssertionError: The path does not end with any of the extensions.
+    """
+    if pattern is not None:
+        assert pattern.search(value), \
+            f'Input file extension for {value} must be {extensions}'
+
+
+class PathExtensionsMixin:
+    """Check file paths against the extensions of an input.
+
+    The classes that use this mixin must have an ``extensions`` field.
+    """
+
+    @property
+    def _extensions_pattern(self) -> Optional[Pattern]:
+        """A case-insensitive pattern that matches any of the extensions."""
+        if not self.extensions:
+            return None
+        return compile_extensions(tuple(self.extensions))
+
+
+def construct_from_template(
+    klass: Type[BaseModel], template: BaseModel, **values: Any
+) -> BaseModel:
+    """Create an object from the fields of a valid template and a few new values.
+
+    The fields that are copied from the template are already valid and are not
+    validated again. Only the new values are validated. List and dictionary fields are
+    copied so the new object does not share them with the template. This is much faster than
+    parsing a dictionary of the template when many step objects are created from the
+    same templates.
+
+    Arguments:
+        klass {Type[BaseModel]} -- The class of the new object.
+        template {BaseModel} -- A valid template object. The type and the fields that
+            are not in klass are ignored.
+        values {Any} -- Values for fields of klass that are validated and set on top of
+            the template fields.
+
+    Returns:
+        BaseModel -- An object of klass.
+
+    Raises:
+        ValidationError: A value is not valid or a required field is missing.
+    """
+    klass_fields = klass.__fields__
+    # lists and dictionaries like default and spec are copied so changing the new
+    # object does not change the template
+    fields = {
+        name: copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+        for name, value in template.__dict__.items()
+        if name in klass_fields and name != 'type'
+    }
+    errors = []
+    for name, value in values.items():
+        value, error = klass_fields[name].validate(value, fields, loc=name, cls=klass)
+        if error:
+            errors.append(error)
+        else:
+            fields[name] = value
+
+    for name, field in klass_fields.items():
+        if field.required and name not in fields and name not in values:
+            errors.append(ErrorWrapper(MissingError(), loc=field.alias))
+
+    if errors:
+        raise ValidationError(errors, klass)
+    fields_set = template.__fields_set__.intersection(fields).union(values)
+    return klass.construct(_fields_set=fields_set, **fields)
+
+
+def default_type_tag(value: Any, field: ModelField) -> Any:
+    """Add the type tag to a value for a union field that is discriminated on type.
+
+    Documents that were written before the unions were discriminated can leave out
+    the type. Like the union did, the value is given the type of the first class in
+    the union that can parse it.
+
+    Arguments:
+        value {Any} -- The raw value for the field.
+        field {ModelField} -- The union field that is discriminated on type.
+
+    Returns:
+        Any -- The value with a type or the input value if it already has a type or
+            none of the classes can parse it.
+    """
+    if not isinstance(value, dict) or 'type' in value:
+        return value
+    for sub_field in field.sub_fields:
+        klass = sub_field.type_
+        try:
+            klass.parse_obj(value)
+        except ValidationError:
+            continue
+        return dict(value, type=klass.__fields__['type'].default)
+    return value
+
 def find_dup_items(values: List) -> List:
     """Find duplicate items in a list
 
@@ -193,7 +510,7 @@ class IOBase(BaseModel):
     IOBase is the baseclass for Function, DAG and Workflow.
     """
 
-    type: constr(regex='^IOBase$') = 'IOBase'
+    type: Literal['IOBase'] = 'IOBase'
 
     inputs: List[Any] = Field(
         None,
@@ -390,7 +707,7 @@ class IOBase(BaseModel):
 class IOAliasHandler(BaseModel):
     """Input and output alias handler object."""
 
-    type: constr(regex='^IOAliasHandler$') = 'IOAliasHandler'
+    type: Literal['IOAliasHandler'] = 'IOAliasHandler'
 
     language: str = Field(
         ...,
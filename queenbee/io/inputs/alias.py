@@ -6,24 +6,26 @@ the original input.
 
 """
 
-import os
-from typing import Dict, Union, List
+import stat
+from typing import ClassVar, Dict, Union, List
 
-from pydantic import constr, Field, validator
-from jsonschema import validate as json_schema_validator
+from pydantic import Field, root_validator, validator
+from pydantic.typing import Annotated, Literal
 
-from ..common import ItemType, GenericInput, find_dup_items, IOAliasHandler
+from ..common import ItemType, STRING_TYPES, GenericInput, \
+    PathExtensionsMixin, SpecValidationMixin, find_dup_items, IOAliasHandler, \
+    json_schema_validator, path_mode, typed_items_schema, validate_path_extensions
 from ..artifact_source import HTTP, S3, ProjectFolder
-from ...base.variable import validate_inputs_outputs_var_format, get_ref_variable
+from ...base.variable import validate_ref_variables
 
 
-class DAGGenericInputAlias(GenericInput):
+class DAGGenericInputAlias(SpecValidationMixin, GenericInput):
     """Base class for DAG Alias inputs.
 
     This class adds a handler to input to handle the process of loading the input
     from different graphical interfaces.
     """
-    type: constr(regex='^DAGGenericInputAlias$') = 'DAGGenericInputAlias'
+    type: Literal['DAGGenericInputAlias'] = 'DAGGenericInputAlias'
 
     platform: List[str] = Field(
         ...,
@@ -55,83 +57,37 @@ class DAGGenericInputAlias(GenericInput):
         'You can use validate_spec method to validate a value against the spec.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
+    @root_validator(skip_on_failure=True)
+    def validate_alias(cls, values):
+        """Validate the default value and the handlers once all the fields are valid.
 
-        Use this for validating workflow inputs against a recipe.
+        This validator checks the referenced variables in the default value, validates
+        the default value against spec if provided and ensures each language is only used
+        once in the handlers. The type field is valid by now so unlike DAG inputs there is
+        no need to check the type against the class name.
         """
-        if self.spec:
-            spec = dict(self.spec)
-            json_schema_validator(value, spec)
-        return value
-
-    @validator('default')
-    def validate_default_refs(cls, v, values):
-        """Validate referenced variables in the command"""
-        try:
-            type_ = values['type']
-        except KeyError:
-            raise ValueError(f'Input with missing type: {cls.__name__}')
-
-        if type_ != cls.__name__ or not isinstance(v, (str, bytes)):
-            # this is a check to ensure the default value only gets validated againt the
-            # correct class type. See spec validation for more information
-            return v
-
-        ref_var = get_ref_variable(v)
-        add_info = []
-        for ref in ref_var:
-            add_info.append(validate_inputs_outputs_var_format(ref))
-
-        if add_info:
-            raise ValueError('\n'.join(add_info))
-
-        return v
-
-
-    @validator('spec')
-    def validate_default_value(cls, v, values):
-        """Validate default value against spec if provided."""
-        try:
-            type_ = values['type']
-        except KeyError:
-            raise ValueError(f'Input with missing type: {cls.__name__}')
-
-        if type_ != cls.__name__:
-            # this is a check to ensure the default value only gets validated againt the
-            # correct class type. The reason we need to do this is that Pydantic doesn't
-            # support discriminators (https://github.com/samuelcolvin/pydantic/issues/619).
-            # As a result in case of checking for Union it checks every possible item
-            # from the start until it finds one. For inputs it causes this check to fail
-            # on a string before it gets to the integer class for an integer input.
-            return v
-
-        try:
-            default = values['default']
-        except KeyError:
-            # spec is not set
-            return v
-
-        if v is not None and default is not None:
-            json_schema_validator(default, v)
-        return v
-
-    @validator('platform', always=True)
-    def create_empty_platform_list(cls, v):
-        return [] if v is None else v
-
-    @validator('handler', always=True)
-    def check_duplicate_platform_name(cls, v, values):
-        v = [] if v is None else v
-        languages = [h.language for h in v]
-        dup_lang = find_dup_items(languages)
-        if dup_lang:
-            raise ValueError(
-                f'Duplicate use of language(s) found in alias handlers for '
-                f'{values["platform"]}: {dup_lang}. Each language can only be used once '
-                'in each platform.'
-            )
-        return v
+        default = values.get('default')
+        if isinstance(default, STRING_TYPES):
+            add_info = validate_ref_variables(default)
+            if add_info:
+                raise ValueError('\n'.join(add_info))
+
+        spec = values.get('spec')
+        if spec is not None and default is not None:
+            json_schema_validator(default, spec)
+
+        handler = values['handler']
+        # most aliases have a single handler which cannot have duplicate languages
+        if len(handler) > 1:
+            dup_lang = find_dup_items([h.language for h in handler])
+            if dup_lang:
+                raise ValueError(
+                    f'Duplicate use of language(s) found in alias handlers for '
+                    f'{values["platform"]}: {dup_lang}. Each language can only be used '
+                    'once in each platform.'
+                )
+
+        return values
 
 
 class DAGLinkedInputAlias(DAGGenericInputAlias):
@@ -140,7 +96,7 @@ class DAGLinkedInputAlias(DAGGenericInputAlias):
     A linked input alias will be hidden in the UI and will be linked to an object in 
     the UI using the input handler.
     """
-    type: constr(regex='^DAGLinkedInputAlias$') = 'DAGLinkedInputAlias'
+    type: Literal['DAGLinkedInputAlias'] = 'DAGLinkedInputAlias'
 
 
 class DAGStringInputAlias(DAGGenericInputAlias):
@@ -161,24 +117,15 @@ class DAGStringInputAlias(DAGGenericInputAlias):
 
     """
 
-    type: constr(regex='^DAGStringInputAlias$') = 'DAGStringInputAlias'
+    type: Literal['DAGStringInputAlias'] = 'DAGStringInputAlias'
+
+    _json_type: ClassVar[str] = 'string'
 
     default: str = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGIntegerInputAlias(DAGGenericInputAlias):
     """An alias integer input.
@@ -189,24 +136,15 @@ class DAGIntegerInputAlias(DAGGenericInputAlias):
     for more information.
 
     """
-    type: constr(regex='^DAGIntegerInputAlias$') = 'DAGIntegerInputAlias'
+    type: Literal['DAGIntegerInputAlias'] = 'DAGIntegerInputAlias'
+
+    _json_type: ClassVar[str] = 'integer'
 
     default: int = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'integer'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGNumberInputAlias(DAGGenericInputAlias):
     """An alias number input.
@@ -216,24 +154,15 @@ class DAGNumberInputAlias(DAGGenericInputAlias):
     See http://json-schema.org/understanding-json-schema/reference/numeric.html#numeric
     for more information.
     """
-    type: constr(regex='^DAGNumberInputAlias$') = 'DAGNumberInputAlias'
+    type: Literal['DAGNumberInputAlias'] = 'DAGNumberInputAlias'
+
+    _json_type: ClassVar[str] = 'number'
 
     default: float = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'number'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGBooleanInputAlias(DAGGenericInputAlias):
     """The boolean type matches only two special values: True and False.
@@ -245,24 +174,15 @@ class DAGBooleanInputAlias(DAGGenericInputAlias):
     See http://json-schema.org/understanding-json-schema/reference/boolean.html for more
     information.
     """
-    type: constr(regex='^DAGBooleanInputAlias$') = 'DAGBooleanInputAlias'
+    type: Literal['DAGBooleanInputAlias'] = 'DAGBooleanInputAlias'
+
+    _json_type: ClassVar[str] = 'boolean'
 
     default: bool = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'boolean'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGFolderInputAlias(DAGGenericInputAlias):
     """An alias folder input.
@@ -282,11 +202,16 @@ class DAGFolderInputAlias(DAGGenericInputAlias):
             "maxLength": 50,
         }
     """
-    type: constr(regex='^DAGFolderInputAlias$') = 'DAGFolderInputAlias'
+    type: Literal['DAGFolderInputAlias'] = 'DAGFolderInputAlias'
+
+    _json_type: ClassVar[str] = 'string'
+
+    is_artifact: ClassVar[bool] = True
 
     default: Union[HTTP, S3, ProjectFolder] = Field(
         None,
-        description='The default source for file if the value is not provided.'
+        description='The default source for file if the value is not provided.',
+        discriminator='type'
     )
 
     @validator('required', always=True)
@@ -299,17 +224,8 @@ class DAGFolderInputAlias(DAGGenericInputAlias):
 
         Use this for validating workflow inputs against a recipe.
         """
-        assert os.path.isdir(value), f'There is no folder at {value}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
-        return value
-
-    @property
-    def is_artifact(self):
-        return True
+        assert stat.S_ISDIR(path_mode(value)), f'There is no folder at {value}'
+        return super().validate_spec(value)
 
     @property
     def is_optional(self):
@@ -317,7 +233,7 @@ class DAGFolderInputAlias(DAGGenericInputAlias):
         return self.default is None and self.required is False
 
 
-class DAGFileInputAlias(DAGFolderInputAlias):
+class DAGFileInputAlias(PathExtensionsMixin, DAGFolderInputAlias):
     """An alias file input.
 
     File is a special string input. Unlike other string inputs, a file will be copied
@@ -339,7 +255,7 @@ class DAGFileInputAlias(DAGFolderInputAlias):
         }
 
     """
-    type: constr(regex='^DAGFileInputAlias$') = 'DAGFileInputAlias'
+    type: Literal['DAGFileInputAlias'] = 'DAGFileInputAlias'
 
     extensions: List[str] = Field(
         None,
@@ -352,19 +268,12 @@ class DAGFileInputAlias(DAGFolderInputAlias):
 
         Use this for validating workflow inputs against a recipe.
         """
-        assert os.path.isfile(value), f'There is no file at {value}'
-        if self.extensions:
-            assert value.lower().endswith(self.extension.lower()), \
-                f'Input file extension for {value} must be {self.extensions}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
+        assert stat.S_ISREG(path_mode(value)), f'There is no file at {value}'
+        validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        return DAGGenericInputAlias.validate_spec(self, value)
 
-        return value
 
-
-class DAGPathInputAlias(DAGFolderInputAlias):
+class DAGPathInputAlias(PathExtensionsMixin, DAGFolderInputAlias):
     """A file or a folder input.
 
     Use this input only in cases that the input can be either a file or folder. For file
@@ -389,7 +298,7 @@ class DAGPathInputAlias(DAGFolderInputAlias):
         }
 
     """
-    type: constr(regex='^DAGPathInputAlias$') = 'DAGPathInputAlias'
+    type: Literal['DAGPathInputAlias'] = 'DAGPathInputAlias'
 
     extensions: List[str] = Field(
         None,
@@ -402,17 +311,13 @@ class DAGPathInputAlias(DAGFolderInputAlias):
 
         Use this for validating workflow inputs against a recipe.
         """
-        if os.path.isfile(value):
-            if self.extensions:
-                assert value.lower().endswith(self.extension.lower()), \
-                    f'Input file extension for {value} must be {self.extensions}'
-        elif not os.path.isdir(value):
+        mode = path_mode(value)
+        if stat.S_ISREG(mode):
+            validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        elif not stat.S_ISDIR(mode):
             raise ValueError(f'{value} is not a valid file or folder.')
 
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
+        return DAGGenericInputAlias.validate_spec(self, value)
 
 
 class DAGArrayInputAlias(DAGGenericInputAlias):
@@ -423,10 +328,12 @@ class DAGArrayInputAlias(DAGGenericInputAlias):
     See http://json-schema.org/understanding-json-schema/reference/array.html for
     more information.
     """
-    type: constr(regex='^DAGArrayInputAlias$') = 'DAGArrayInputAlias'
+    type: Literal['DAGArrayInputAlias'] = 'DAGArrayInputAlias'
+
+    _json_type: ClassVar[str] = 'array'
 
     default: List = Field(
-        None,
+        default_factory=list,
         description='Default value to use for an input if a value was not supplied.'
     )
 
@@ -436,20 +343,15 @@ class DAGArrayInputAlias(DAGGenericInputAlias):
         'the same type.'
     )
 
-    @validator('default', always=True)
+    @validator('default', pre=True)
     def replace_none_value(cls, v):
-        return [] if not v else v
-
-    def validate_spec(self, value):
-        """Validate an input value against specification.
+        return [] if v is None else v
 
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'array'
-            spec['items'] = self.items_type.lower()
-            json_schema_validator(value, spec)
+    def _build_typed_spec(self) -> Dict:
+        """Get a copy of spec with the JSON type of this input and its items."""
+        spec = super()._build_typed_spec()
+        spec['items'] = typed_items_schema(spec.get('items'), self.items_type)
+        return spec
 
 
 class DAGJSONObjectInputAlias(DAGGenericInputAlias):
@@ -462,30 +364,26 @@ class DAGJSONObjectInputAlias(DAGGenericInputAlias):
     See http://json-schema.org/understanding-json-schema/reference/object.html for
     more information.
     """
-    type: constr(regex='^DAGJSONObjectInputAlias$') = 'DAGJSONObjectInputAlias'
+    type: Literal['DAGJSONObjectInputAlias'] = 'DAGJSONObjectInputAlias'
+
+    _json_type: ClassVar[str] = 'object'
 
     default: Dict = Field(
-        None,
+        default_factory=dict,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    @validator('default', always=True)
+    @validator('default', pre=True)
     def replace_none_value(cls, v):
-        return {} if not v else v
-
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'object'
-            json_schema_validator(value, spec)
+        return {} if v is None else v
 
 
-DAGAliasInputs = Union[
-    DAGGenericInputAlias, DAGStringInputAlias, DAGIntegerInputAlias, DAGNumberInputAlias,
-    DAGBooleanInputAlias, DAGFolderInputAlias, DAGFileInputAlias, DAGPathInputAlias,
-    DAGArrayInputAlias, DAGJSONObjectInputAlias, DAGLinkedInputAlias
+DAGAliasInputs = Annotated[
+    Union[
+        DAGGenericInputAlias, DAGStringInputAlias, DAGIntegerInputAlias,
+        DAGNumberInputAlias, DAGBooleanInputAlias, DAGFolderInputAlias,
+        DAGFileInputAlias, DAGPathInputAlias, DAGArrayInputAlias,
+        DAGJSONObjectInputAlias, DAGLinkedInputAlias
+    ],
+    Field(discriminator='type')
 ]
@@ -1,24 +1,26 @@
 """Queenbee input types for a DAG."""
 
-import os
-from typing import Dict, Union, List
+import stat
+from typing import ClassVar, Dict, Union, List
 
-from pydantic import constr, Field, validator
-from jsonschema import validate as json_schema_validator
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
-from ..common import ItemType, GenericInput
+from ..common import ItemType, STRING_TYPES, GenericInput, \
+    PathExtensionsMixin, SpecValidationMixin, json_schema_validator, path_mode, \
+    typed_items_schema, validate_path_extensions
 from ..artifact_source import HTTP, S3, ProjectFolder
 from .alias import DAGAliasInputs
-from ...base.variable import validate_inputs_outputs_var_format, get_ref_variable
+from ...base.variable import validate_ref_variables
 
 
-class DAGGenericInput(GenericInput):
+class DAGGenericInput(SpecValidationMixin, GenericInput):
     """Base class for DAG inputs.
 
     This class adds a handler to input to handle the process of loading the input
     from different graphical interfaces.
     """
-    type: constr(regex='^DAGGenericInput$') = 'DAGGenericInput'
+    type: Literal['DAGGenericInput'] = 'DAGGenericInput'
 
     default: str = Field(
         None,
@@ -26,7 +28,7 @@ class DAGGenericInput(GenericInput):
     )
 
     alias: List[DAGAliasInputs] = Field(
-        None,
+        default_factory=list,
         description='A list of aliases for this input in different platforms.'
     )
 
@@ -43,16 +45,6 @@ class DAGGenericInput(GenericInput):
         'You can use validate_spec method to validate a value against the spec.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            json_schema_validator(value, spec)
-        return value
-
     @validator('required', always=True)
     def check_required(cls, v, values):
         """Ensure required is set to True when default value is not provided."""
@@ -68,56 +60,41 @@ class DAGGenericInput(GenericInput):
     @validator('spec')
     def validate_default_value(cls, v, values):
         """Validate default value against spec if provided."""
-        try:
-            type_ = values['type']
-        except KeyError:
-            raise ValueError(f'Input with missing type: {cls.__name__}')
-
-        if type_ != cls.__name__:
-            # this is a check to ensure the default value only gets validated againt the
-            # correct class type. The reason we need to do this is that Pydantic doesn't
-            # support discriminators (https://github.com/samuelcolvin/pydantic/issues/619).
-            # As a result in case of checking for Union it checks every possible item
-            # from the start until it finds one. For inputs it causes this check to fail
-            # on a string before it gets to the integer class for an integer input.
+        if v is None:
+            # most inputs do not have a spec
             return v
 
-        try:
-            default = values['default']
-        except KeyError:
-            # spec is not set
+        if values.get('type') != cls.__name__:
+            # type is missing from values if it failed validation. Inputs are parsed
+            # through a discriminated union on type so this only happens when an input
+            # class is used directly with the wrong type.
             return v
 
-        if v is not None and default is not None:
+        # default is missing from values if it failed validation
+        default = values.get('default')
+        if default is not None:
             json_schema_validator(default, v)
         return v
 
     @validator('default')
     def validate_default_refs(cls, v, values):
         """Validate referenced variables in the command"""
-        try:
-            type_ = values['type']
-        except KeyError:
-            raise ValueError(f'Input with missing type: {cls.__name__}')
-
-        if type_ != cls.__name__ or not isinstance(v, (str, bytes)):
-            # this is a check to ensure the default value only gets validated againt the
-            # correct class type. See spec validation for more information
+        if values.get('type') != cls.__name__ or not isinstance(v, STRING_TYPES):
+            # see validate_default_value for the type check
             return v
 
-        ref_var = get_ref_variable(v)
-        add_info = []
-        for ref in ref_var:
-            add_info.append(validate_inputs_outputs_var_format(ref))
-
+        add_info = validate_ref_variables(v)
         if add_info:
             raise ValueError('\n'.join(add_info))
 
         return v
 
-    @validator('alias', always=True)
+    @validator('alias', pre=True)
+    def create_empty_alias_list(cls, v):
+        return [] if v is None else v
+
+    @validator('alias')
     def check_alias_required(cls, v):
-        v = [] if v is None else v
         for alias in v:
             default = alias.default
             name = alias.name
@@ -148,24 +125,15 @@ class DAGStringInput(DAGGenericInput):
 
     """
 
-    type: constr(regex='^DAGStringInput$') = 'DAGStringInput'
+    type: Literal['DAGStringInput'] = 'DAGStringInput'
+
+    _json_type: ClassVar[str] = 'string'
 
     default: str = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGIntegerInput(DAGGenericInput):
     """An integer input.
@@ -176,24 +144,15 @@ class DAGIntegerInput(DAGGenericInput):
     for more information.
 
     """
-    type: constr(regex='^DAGIntegerInput$') = 'DAGIntegerInput'
+    type: Literal['DAGIntegerInput'] = 'DAGIntegerInput'
+
+    _json_type: ClassVar[str] = 'integer'
 
     default: int = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'integer'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGNumberInput(DAGGenericInput):
     """A number input.
@@ -203,24 +162,15 @@ class DAGNumberInput(DAGGenericInput):
     See http://json-schema.org/understanding-json-schema/reference/numeric.html#numeric
     for more information.
     """
-    type: constr(regex='^DAGNumberInput$') = 'DAGNumberInput'
+    type: Literal['DAGNumberInput'] = 'DAGNumberInput'
+
+    _json_type: ClassVar[str] = 'number'
 
     default: float = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'number'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGBooleanInput(DAGGenericInput):
     """The boolean type matches only two special values: True and False.
@@ -232,24 +182,15 @@ class DAGBooleanInput(DAGGenericInput):
     See http://json-schema.org/understanding-json-schema/reference/boolean.html for more
     information.
     """
-    type: constr(regex='^DAGBooleanInput$') = 'DAGBooleanInput'
+    type: Literal['DAGBooleanInput'] = 'DAGBooleanInput'
+
+    _json_type: ClassVar[str] = 'boolean'
 
     default: bool = Field(
         None,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
-
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'boolean'
-            json_schema_validator(value, spec)
-        return value
-
 
 class DAGFolderInput(DAGGenericInput):
     """A folder input.
@@ -269,11 +210,16 @@ class DAGFolderInput(DAGGenericInput):
             "maxLength": 50,
         }
     """
-    type: constr(regex='^DAGFolderInput$') = 'DAGFolderInput'
+    type: Literal['DAGFolderInput'] = 'DAGFolderInput'
+
+    _json_type: ClassVar[str] = 'string'
+
+    is_artifact: ClassVar[bool] = True
 
     default: Union[HTTP, S3, ProjectFolder] = Field(
         None,
-        description='The default source for file if the value is not provided.'
+        description='The default source for file if the value is not provided.',
+        discriminator='type'
     )
 
     @validator('required', always=True)
@@ -281,30 +227,21 @@ class DAGFolderInput(DAGGenericInput):
         """Overwrite check_required for artifacts to allow optional artifacts."""
         return [] if v is None else v
 
-    @validator('alias', always=True)
+    @validator('alias')
     def check_alias_required(cls, v):
         """Overwrite check_alias_required for artifacts.
 
-        This will allow None input for aliases for optional artifacts.
+        This will allow aliases without a default value for optional artifacts.
         """
-        return [] if v is None else v
+        return v
 
     def validate_spec(self, value):
         """Validate an input value against specification.
 
         Use this for validating workflow inputs against a recipe.
         """
-        assert os.path.isdir(value), f'There is no folder at {value}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
-        return value
-
-    @property
-    def is_artifact(self):
-        return True
+        assert stat.S_ISDIR(path_mode(value)), f'There is no folder at {value}'
+        return super().validate_spec(value)
 
     @property
     def is_optional(self):
@@ -312,7 +249,7 @@ class DAGFolderInput(DAGGenericInput):
         return self.default is None and self.required is False
 
 
-class DAGFileInput(DAGFolderInput):
+class DAGFileInput(PathExtensionsMixin, DAGFolderInput):
     """A file input.
 
     File is a special string input. Unlike other string inputs, a file will be copied
@@ -334,7 +271,7 @@ class DAGFileInput(DAGFolderInput):
         }
 
     """
-    type: constr(regex='^DAGFileInput$') = 'DAGFileInput'
+    type: Literal['DAGFileInput'] = 'DAGFileInput'
 
     extensions: List[str] = Field(
         None,
@@ -347,19 +284,12 @@ class DAGFileInput(DAGFolderInput):
 
         Use this for validating workflow inputs against a recipe.
         """
-        assert os.path.isfile(value), f'There is no file at {value}'
-        if self.extensions:
-            assert value.lower().endswith(self.extension.lower()), \
-                f'Input file extension for {value} must be {self.extensions}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
-
-        return value
+        assert stat.S_ISREG(path_mode(value)), f'There is no file at {value}'
+        validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        return DAGGenericInput.validate_spec(self, value)
 
 
-class DAGPathInput(DAGFolderInput):
+class DAGPathInput(PathExtensionsMixin, DAGFolderInput):
     """A file or a folder input.
 
     Use this input only in cases that the input can be either a file or folder. For file
@@ -384,7 +314,7 @@ class DAGPathInput(DAGFolderInput):
         }
 
     """
-    type: constr(regex='^DAGPathInput$') = 'DAGPathInput'
+    type: Literal['DAGPathInput'] = 'DAGPathInput'
 
     extensions: List[str] = Field(
         None,
@@ -397,17 +327,13 @@ class DAGPathInput(DAGFolderInput):
 
         Use this for validating workflow inputs against a recipe.
         """
-        if os.path.isfile(value):
-            if self.extensions:
-                assert value.lower().endswith(self.extension.lower()), \
-                    f'Input file extension for {value} must be {self.extensions}'
-        elif not os.path.isdir(value):
+        mode = path_mode(value)
+        if stat.S_ISREG(mode):
+            validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        elif not stat.S_ISDIR(mode):
             raise ValueError(f'{value} is not a valid file or folder.')
 
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
+        return DAGGenericInput.validate_spec(self, value)
 
 
 class DAGArrayInput(DAGGenericInput):
@@ -418,10 +344,12 @@ class DAGArrayInput(DAGGenericInput):
     See http://json-schema.org/understanding-json-schema/reference/array.html for
     more information.
     """
-    type: constr(regex='^DAGArrayInput$') = 'DAGArrayInput'
+    type: Literal['DAGArrayInput'] = 'DAGArrayInput'
+
+    _json_type: ClassVar[str] = 'array'
 
     default: List = Field(
-        None,
+        default_factory=list,
         description='Default value to use for an input if a value was not supplied.'
     )
 
@@ -431,20 +359,15 @@ class DAGArrayInput(DAGGenericInput):
         'the same type.'
     )
 
-    @validator('default', always=True)
+    @validator('default', pre=True)
     def replace_none_value(cls, v):
-        return [] if not v else v
-
-    def validate_spec(self, value):
-        """Validate an input value against specification.
+        return [] if v is None else v
 
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'array'
-            spec['items'] = self.items_type.lower()
-            json_schema_validator(value, spec)
+    def _build_typed_spec(self) -> Dict:
+        """Get a copy of spec with the JSON type of this input and its items."""
+        spec = super()._build_typed_spec()
+        spec['items'] = typed_items_schema(spec.get('items'), self.items_type)
+        return spec
 
 
 class DAGJSONObjectInput(DAGGenericInput):
@@ -457,29 +380,26 @@ class DAGJSONObjectInput(DAGGenericInput):
     See http://json-schema.org/understanding-json-schema/reference/object.html for
     more information.
     """
-    type: constr(regex='^DAGJSONObjectInput$') = 'DAGJSONObjectInput'
+    type: Literal['DAGJSONObjectInput'] = 'DAGJSONObjectInput'
+
+    _json_type: ClassVar[str] = 'object'
 
     default: Dict = Field(
-        None,
+        default_factory=dict,
         description='Default value to use for an input if a value was not supplied.'
     )
 
-    @validator('default', always=True)
+    @validator('default', pre=True)
     def replace_none_value(cls, v):
-        return {} if not v else v
+        return {} if v is None else v
 
-    def validate_spec(self, value):
-        """Validate an input value against specification.
 
-        Use this for validating workflow inputs against a recipe.
-        """
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'object'
-            json_schema_validator(value, spec)
-
-
-DAGInputs = Union[
-    DAGGenericInput, DAGStringInput, DAGIntegerInput, DAGNumberInput, DAGBooleanInput,
-    DAGFolderInput, DAGFileInput, DAGPathInput, DAGArrayInput, DAGJSONObjectInput
+DAGInputs = Annotated[
+    Union[
+        DAGGenericInput, DAGStringInput, DAGIntegerInput, DAGNumberInput,
+        DAGBooleanInput, DAGFolderInput, DAGFileInput, DAGPathInput, DAGArrayInput,
+        DAGJSONObjectInput
+    ],
+    Field(discriminator='type')
 ]
+
@@ -3,13 +3,14 @@
 For more information on plugins see plugin module.
 """
 
-import os
+import stat
 from typing import Union, List, Dict
-from pydantic import constr, Field, validator
-from jsonschema import validate as json_schema_validator
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
-from .dag import DAGStringInput, DAGIntegerInput, DAGNumberInput, DAGBooleanInput, \
-    DAGFolderInput, DAGArrayInput, DAGJSONObjectInput
+from ..common import PathExtensionsMixin, path_mode, validate_path_extensions
+from .dag import DAGGenericInput, DAGStringInput, DAGIntegerInput, DAGNumberInput, \
+    DAGBooleanInput, DAGFolderInput, DAGArrayInput, DAGJSONObjectInput
 
 
 class FunctionStringInput(DAGStringInput):
@@ -30,7 +31,7 @@ class FunctionStringInput(DAGStringInput):
 
     """
 
-    type: constr(regex='^FunctionStringInput$') = 'FunctionStringInput'
+    type: Literal['FunctionStringInput'] = 'FunctionStringInput'
 
 
 class FunctionIntegerInput(DAGIntegerInput):
@@ -42,7 +43,7 @@ class FunctionIntegerInput(DAGIntegerInput):
     for more information.
 
     """
-    type: constr(regex='^FunctionIntegerInput$') = 'FunctionIntegerInput'
+    type: Literal['FunctionIntegerInput'] = 'FunctionIntegerInput'
 
 
 class FunctionNumberInput(DAGNumberInput):
@@ -53,7 +54,7 @@ class FunctionNumberInput(DAGNumberInput):
     See http://json-schema.org/understanding-json-schema/reference/numeric.html#numeric
     for more information.
     """
-    type: constr(regex='^FunctionNumberInput$') = 'FunctionNumberInput'
+    type: Literal['FunctionNumberInput'] = 'FunctionNumberInput'
 
 
 class FunctionBooleanInput(DAGBooleanInput):
@@ -66,7 +67,7 @@ class FunctionBooleanInput(DAGBooleanInput):
     See http://json-schema.org/understanding-json-schema/reference/boolean.html for more
     information.
     """
-    type: constr(regex='^FunctionBooleanInput$') = 'FunctionBooleanInput'
+    type: Literal['FunctionBooleanInput'] = 'FunctionBooleanInput'
 
 
 class FunctionFolderInput(DAGFolderInput):
@@ -87,7 +88,7 @@ class FunctionFolderInput(DAGFolderInput):
             "maxLength": 50,
         }
     """
-    type: constr(regex='^FunctionFolderInput$') = 'FunctionFolderInput'
+    type: Literal['FunctionFolderInput'] = 'FunctionFolderInput'
 
     # TODO: Change this path to target_path and the one for output to source_path
     # for this iteration I'm keeping the changes as minimum as possible to break as
@@ -115,7 +116,7 @@ class FunctionFolderInput(DAGFolderInput):
         return self._referenced_values(['path'])
 
 
-class FunctionFileInput(FunctionFolderInput):
+class FunctionFileInput(PathExtensionsMixin, FunctionFolderInput):
     """A file input.
 
     File is a special string input. Unlike other string inputs, a file will be copied
@@ -137,7 +138,7 @@ class FunctionFileInput(FunctionFolderInput):
         }
 
     """
-    type: constr(regex='^FunctionFileInput$') = 'FunctionFileInput'
+    type: Literal['FunctionFileInput'] = 'FunctionFileInput'
 
     extensions: List[str] = Field(
         None,
@@ -150,14 +151,9 @@ class FunctionFileInput(FunctionFolderInput):
 
         Use this for validating workflow inputs against a recipe.
         """
-        assert os.path.isfile(value), f'There is no file at {value}'
-        if self.extensions:
-            assert value.lower().endswith(self.extension.lower()), \
-                f'Input file extension for {value} must be {self.extensions}'
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
+        assert stat.S_ISREG(path_mode(value)), f'There is no file at {value}'
+        validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        return DAGGenericInput.validate_spec(self, value)
 
 
 class FunctionPathInput(FunctionFileInput):
@@ -185,24 +181,20 @@ class FunctionPathInput(FunctionFileInput):
         }
 
     """
-    type: constr(regex='^FunctionPathInput$') = 'FunctionPathInput'
+    type: Literal['FunctionPathInput'] = 'FunctionPathInput'
 
     def validate_spec(self, value):
         """Validate an input value against specification.
 
         Use this for validating workflow inputs against a recipe.
         """
-        if os.path.isfile(value):
-            if self.extensions:
-                assert value.lower().endswith(self.extension.lower()), \
-                    f'Input file extension for {value} must be {self.extensions}'
-        elif not os.path.isdir(value):
+        mode = path_mode(value)
+        if stat.S_ISREG(mode):
+            validate_path_extensions(self._extensions_pattern, value, self.extensions)
+        elif not stat.S_ISDIR(mode):
             raise ValueError(f'{value} is not a valid file or folder.')
 
-        if self.spec:
-            spec = dict(self.spec)
-            spec['type'] = 'string'
-            json_schema_validator(value, spec)
+        return DAGGenericInput.validate_spec(self, value)
 
 
 class FunctionArrayInput(DAGArrayInput):
@@ -213,7 +205,7 @@ class FunctionArrayInput(DAGArrayInput):
     See http://json-schema.org/understanding-json-schema/reference/array.html for
     more information.
     """
-    type: constr(regex='^FunctionArrayInput$') = 'FunctionArrayInput'
+    type: Literal['FunctionArrayInput'] = 'FunctionArrayInput'
 
 
 class FunctionJSONObjectInput(DAGJSONObjectInput):
@@ -226,11 +218,15 @@ class FunctionJSONObjectInput(DAGJSONObjectInput):
     See http://json-schema.org/understanding-json-schema/reference/object.html for
     more information.
     """
-    type: constr(regex='^FunctionJSONObjectInput$') = 'FunctionJSONObjectInput'
+    type: Literal['FunctionJSONObjectInput'] = 'FunctionJSONObjectInput'
 
 
-FunctionInputs = Union[
-    FunctionStringInput, FunctionIntegerInput, FunctionNumberInput,
-    FunctionBooleanInput, FunctionFolderInput, FunctionFileInput, FunctionPathInput,
-    FunctionArrayInput, FunctionJSONObjectInput
+FunctionInputs = Annotated[
+    Union[
+        FunctionStringInput, FunctionIntegerInput, FunctionNumberInput,
+        FunctionBooleanInput, FunctionFolderInput, FunctionFileInput, FunctionPathInput,
+        FunctionArrayInput, FunctionJSONObjectInput
+    ],
+    Field(discriminator='type')
 ]
+
@@ -1,9 +1,11 @@
 """Input objects for Queenbee jobs."""
 from typing import Dict, List, Union, Any
 
-from pydantic import Field, constr
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
 from ..artifact_source import HTTP, S3, ProjectFolder
+from ..common import default_type_tag
 from ...base.basemodel import BaseModel
 from ...base.parser import parse_file
 
@@ -11,7 +13,7 @@ from ...base.parser import parse_file
 class JobArgument(BaseModel):
     """Job argument is an argument input for arguments which are not files or folders."""
 
-    type: constr(regex='^JobArgument$') = 'JobArgument'
+    type: Literal['JobArgument'] = 'JobArgument'
 
     name: str = Field(
         ...,
@@ -34,7 +36,7 @@ class JobArgument(BaseModel):
 
 
 class JobPathArgument(BaseModel):
-    type: constr(regex='^JobPathArgument$') = 'JobPathArgument'
+    type: Literal['JobPathArgument'] = 'JobPathArgument'
 
     name: str = Field(
         ...,
@@ -44,9 +46,14 @@ class JobPathArgument(BaseModel):
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
+    @validator('source', pre=True)
+    def default_source_type(cls, v, field):
+        return default_type_tag(v, field)
+
     @property
     def is_artifact(self):
         return True
@@ -56,27 +63,47 @@ class JobPathArgument(BaseModel):
         return not self.is_artifact
 
 
-JobArguments = Union[JobArgument, JobPathArgument]
+JobArguments = Annotated[
+    Union[JobArgument, JobPathArgument],
+    Field(discriminator='type')
+]
+
 
+# job argument classes by their type to load job arguments from dictionaries
+_JOB_ARGUMENT_CLASSES = {
+    'JobArgument': JobArgument,
+    'JobPathArgument': JobPathArgument
+}
 
-def load_job_arguments(fp: str) -> List[JobArguments]:
+
+def load_job_arguments(fp: str, trusted: bool = False) -> List[JobArguments]:
     """Load Job arguments from a JSON or YAML file.
 
     Args:
         fp: File path to a JSON or YAML file with a list of JobArguments.
+        trusted: Skip validating the JobArgument values. Trusted arguments must
+            already be valid. See load_job_arguments_from_dict for more information.
 
     Returns:
         List - A list of of JobArgument and JobPathArgument objects.
     """
     data = parse_file(fp)
-    return load_job_arguments_from_dict(data)
+    return load_job_arguments_from_dict(data, trusted=trusted)
 
 
-def load_job_arguments_from_dict(data: List[Dict]) -> List[JobArguments]:
+def load_job_arguments_from_dict(
+    data: List[Dict], trusted: bool = False
+) -> List[JobArguments]:
     """Load Job arguments from a list of dictionaries.
 
     Args:
         data: A list of job arguments as dictionaries.
+        trusted: Set to True to create JobArgument objects with construct, which
+            skips validation. Trusted arguments must already be valid: invalid values
+            are not caught and end up in the returned objects as they are. Only use it
+            for arguments that queenbee wrote from valid objects (e.g. using to_dict),
+            never for arguments provided by users. JobPathArgument objects are always
+            validated because their source must be parsed (default: False).
 
     Returns:
         List - A list of of JobArgument and JobPathArgument objects.
@@ -90,15 +117,16 @@ def load_job_arguments_from_dict(data: List[Dict]) -> List[JobArguments]:
                 'Input argument with missing "type" key. Valid types are: '
                 f'JobArgument and JobPathArgument:\n{d}'
             )
-        if arg_type == 'JobArgument':
-            arg = JobArgument.parse_obj(d)
-        elif arg_type == 'JobPathArgument':
-            arg = JobPathArgument.parse_obj(d)
-        else:
+        try:
+            arg_class = _JOB_ARGUMENT_CLASSES[arg_type]
+        except KeyError:
             raise ValueError(
                 f'Invalid type for Job argument: {arg_type}.'
                 'Valid types are: JobArgument and JobPathArgument.'
             )
-        args.append(arg)
+        if trusted and arg_class is JobArgument:
+            args.append(JobArgument.construct(**d))
+        else:
+            args.append(arg_class.parse_obj(d))
 
     return args
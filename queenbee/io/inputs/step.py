@@ -5,7 +5,8 @@ For more information on plugins see plugin module.
 
 import json
 from typing import Union, List, Dict, Any
-from pydantic import constr, Field, root_validator
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
 from .function import FunctionStringInput, FunctionIntegerInput, \
     FunctionNumberInput, FunctionBooleanInput, FunctionFolderInput, \
@@ -17,12 +18,13 @@ from .dag import DAGStringInput, DAGIntegerInput, DAGNumberInput, \
     DAGArrayInput, DAGJSONObjectInput, DAGInputs
 
 from ..artifact_source import HTTP, S3, ProjectFolder
+from ..common import construct_from_template, default_type_tag
 
 
 class StepStringInput(FunctionStringInput):
     """A String input."""
 
-    type: constr(regex='^StepStringInput$') = 'StepStringInput'
+    type: Literal['StepStringInput'] = 'StepStringInput'
 
     value: str
 
@@ -30,7 +32,7 @@ class StepStringInput(FunctionStringInput):
 class StepIntegerInput(FunctionIntegerInput):
     """An integer input."""
 
-    type: constr(regex='^StepIntegerInput$') = 'StepIntegerInput'
+    type: Literal['StepIntegerInput'] = 'StepIntegerInput'
 
     value: int
 
@@ -38,7 +40,7 @@ class StepIntegerInput(FunctionIntegerInput):
 class StepNumberInput(FunctionNumberInput):
     """A number input."""
 
-    type: constr(regex='^StepNumberInput$') = 'StepNumberInput'
+    type: Literal['StepNumberInput'] = 'StepNumberInput'
 
     value: float
 
@@ -46,18 +48,19 @@ class StepNumberInput(FunctionNumberInput):
 class StepBooleanInput(FunctionBooleanInput):
     """The boolean type matches only two special values: True and False."""
 
-    type: constr(regex='^StepBooleanInput$') = 'StepBooleanInput'
+    type: Literal['StepBooleanInput'] = 'StepBooleanInput'
 
     value: bool
 
 
 class StepFolderInput(FunctionFolderInput):
     """A folder input."""
-    type: constr(regex='^StepFolderInput$') = 'StepFolderInput'
+    type: Literal['StepFolderInput'] = 'StepFolderInput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
     # TODO: Change this path to target_path and the one for output to source_path
@@ -69,15 +72,20 @@ class StepFolderInput(FunctionFolderInput):
         ' This path is relative to the working directory where the command is executed.'
     )
 
+    @validator('source', pre=True)
+    def default_source_type(cls, v, field):
+        return default_type_tag(v, field)
+
 
 class StepFileInput(FunctionFileInput):
     """A file input."""
 
-    type: constr(regex='^StepFileInput$') = 'StepFileInput'
+    type: Literal['StepFileInput'] = 'StepFileInput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
     # TODO: Change this path to target_path and the one for output to source_path
@@ -89,15 +97,20 @@ class StepFileInput(FunctionFileInput):
         ' This path is relative to the working directory where the command is executed.'
     )
 
+    @validator('source', pre=True)
+    def default_source_type(cls, v, field):
+        return default_type_tag(v, field)
+
 
 class StepPathInput(FunctionPathInput):
     """A file or a folder input."""
 
-    type: constr(regex='^StepPathInput$') = 'StepPathInput'
+    type: Literal['StepPathInput'] = 'StepPathInput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
     # TODO: Change this path to target_path and the one for output to source_path
@@ -109,11 +122,15 @@ class StepPathInput(FunctionPathInput):
         ' This path is relative to the working directory where the command is executed.'
     )
 
+    @validator('source', pre=True)
+    def default_source_type(cls, v, field):
+        return default_type_tag(v, field)
+
 
 class StepArrayInput(FunctionArrayInput):
     """A JSON array input."""
 
-    type: constr(regex='^StepArrayInput$') = 'StepArrayInput'
+    type: Literal['StepArrayInput'] = 'StepArrayInput'
 
     value: List
 
@@ -121,19 +138,47 @@ class StepArrayInput(FunctionArrayInput):
 class StepJSONObjectInput(FunctionJSONObjectInput):
     """A JSON object input."""
 
-    type: constr(regex='^StepJSONObjectInput$') = 'StepJSONObjectInput'
+    type: Literal['StepJSONObjectInput'] = 'StepJSONObjectInput'
 
     value: Dict
 
 
-StepInputs = Union[
-    StepStringInput, StepIntegerInput, StepNumberInput,
-    StepBooleanInput, StepFolderInput, StepFileInput, StepPathInput,
-    StepArrayInput, StepJSONObjectInput
+StepInputs = Annotated[
+    Union[
+        StepStringInput, StepIntegerInput, StepNumberInput,
+        StepBooleanInput, StepFolderInput, StepFileInput, StepPathInput,
+        StepArrayInput, StepJSONObjectInput
+    ],
+    Field(discriminator='type')
 ]
 
 
-def from_template(template: Union[DAGInputs, FunctionInputs], value: Any) -> StepInputs:
+# step input class for each template input class
+_STEP_INPUT_CLASSES = {
+    DAGStringInput: StepStringInput,
+    FunctionStringInput: StepStringInput,
+    DAGIntegerInput: StepIntegerInput,
+    FunctionIntegerInput: StepIntegerInput,
+    DAGNumberInput: StepNumberInput,
+    FunctionNumberInput: StepNumberInput,
+    DAGBooleanInput: StepBooleanInput,
+    FunctionBooleanInput: StepBooleanInput,
+    DAGFolderInput: StepFolderInput,
+    FunctionFolderInput: StepFolderInput,
+    DAGFileInput: StepFileInput,
+    FunctionFileInput: StepFileInput,
+    DAGPathInput: StepPathInput,
+    FunctionPathInput: StepPathInput,
+    DAGArrayInput: StepArrayInput,
+    FunctionArrayInput: StepArrayInput,
+    DAGJSONObjectInput: StepJSONObjectInput,
+    FunctionJSONObjectInput: StepJSONObjectInput
+}
+
+
+def from_template(
+    template: Union[DAGInputs, FunctionInputs], value: Any, validate: bool = False
+) -> StepInputs:
     """Generate a step input from a template input type and a value
 
     Args:
@@ -141,52 +186,43 @@ def from_template(template: Union[DAGInputs, FunctionInputs], value: Any) -> Ste
             template (DAG or Function)
         value {Any} -- The input value calculated for this template in
             the workflow step
+        validate {bool} -- Set to True to validate the fields that are copied from the
+            template. By default only the value is validated because the template
+            is already valid (default: False).
 
     Returns:
         StepInputs -- A Step Input object
     """
 
-    template_dict = template.to_dict()
-    del template_dict['type']
-
-    if template.is_artifact:
-        template_dict['source'] = value
-    elif template.is_parameter:
-        template_dict['value'] = value
-
-    if template.__class__ in [DAGStringInput, FunctionStringInput]:
-        return StepStringInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGIntegerInput, FunctionIntegerInput]:
-        template_dict['value'] = int(float(template_dict['value']))
-        return StepIntegerInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGNumberInput, FunctionNumberInput]:
-        return StepNumberInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGBooleanInput, FunctionBooleanInput]:
-        return StepBooleanInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGFolderInput, FunctionFolderInput]:
-        return StepFolderInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGFileInput, FunctionFileInput]:
-        return StepFileInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGPathInput, FunctionPathInput]:
-        return StepPathInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGArrayInput, FunctionArrayInput]:
-        if isinstance(template_dict['value'], str):
-            template_dict['value'] = json.loads(template_dict['value'])
-        return StepArrayInput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGJSONObjectInput, FunctionJSONObjectInput]:
-        if isinstance(template_dict['value'], str):
-            template_dict['value'] = json.loads(template_dict['value'])
-        try:
-            # Try to parse JSON as a dict
-            return StepJSONObjectInput.parse_obj(template_dict)
-        except:
-            # Try to parse JSON as an array
-            return StepArrayInput.parse_obj(template_dict)
+    step_class = _STEP_INPUT_CLASSES.get(template.__class__)
+    if step_class is None:
+        # not a DAG or function input
+        return None
+
+    excluded_fields = ('type',)
+    if step_class is StepIntegerInput:
+        value = int(float(value))
+    elif step_class is StepArrayInput or step_class is StepJSONObjectInput:
+        if isinstance(value, str):
+            value = json.loads(value)
+        if step_class is StepJSONObjectInput and isinstance(value, list):
+            # a JSON array is accepted for a JSON object input and is returned as an
+            # array input. The default value and the spec of the JSON object input do
+            # not apply to an array and are not copied.
+            step_class = StepArrayInput
+            excluded_fields = ('type', 'default', 'spec')
+            validate = True
+
+    name = 'source' if template.is_artifact else 'value'
+    if not validate:
+        return construct_from_template(step_class, template, **{name: value})
+
+    # the template fields are copied as they are instead of serializing the template
+    template_dict = {
+        field.alias: getattr(template, field_name)
+        for field_name, field in template.__fields__.items()
+        if field_name not in excluded_fields
+    }
+    template_dict[name] = value
+
+    return step_class.parse_obj(template_dict)
@@ -3,11 +3,13 @@
 Use these alias outputs to create a different IO object for client side UIs.
 """
 
-from typing import Union, List
+from typing import ClassVar, List, Union
 
-from pydantic import constr, Field, validator
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
-from ..common import ItemType, GenericOutput, find_dup_items, IOAliasHandler
+from ..common import ItemType, GenericOutput, default_type_tag, find_dup_items, \
+    IOAliasHandler
 from ..reference import FileReference, FolderReference, TaskReference
 
 
@@ -18,7 +20,7 @@ class DAGGenericOutputAlias(GenericOutput):
     output that changes its type in different platforms because of returning different
     objects in handler.
     """
-    type: constr(regex='^DAGGenericOutputAlias$') = 'DAGGenericOutputAlias'
+    type: Literal['DAGGenericOutputAlias'] = 'DAGGenericOutputAlias'
 
     platform: List[str] = Field(
         ...,
@@ -32,21 +34,18 @@ class DAGGenericOutputAlias(GenericOutput):
         description='List of process actions to process the input or output value.'
     )
 
-    @validator('platform', always=True)
-    def create_empty_platform_list(cls, v):
-        return [] if v is None else v
-
-    @validator('handler', always=True)
+    @validator('handler')
     def check_duplicate_platform_name(cls, v, values):
-        v = [] if v is None else v
-        languages = [h.language for h in v]
-        dup_lang = find_dup_items(languages)
-        if dup_lang:
-            raise ValueError(
-                f'Duplicate use of language(s) found in alias handlers for '
-                f'{values["platform"]}: {dup_lang}. Each language can only be used once '
-                'in each platform.'
-            )
+        # most aliases have a single handler which cannot have duplicate languages
+        if len(v) > 1:
+            dup_lang = find_dup_items([h.language for h in v])
+            if dup_lang:
+                # platform is missing from values only if it has failed validation
+                platform = f' for {values["platform"]}' if 'platform' in values else ''
+                raise ValueError(
+                    f'Duplicate use of language(s) found in alias handlers{platform}: '
+                    f'{dup_lang}. Each language can only be used once in each platform.'
+                )
         return v
 
 
@@ -56,7 +55,7 @@ class DAGLinkedOutputAlias(DAGGenericOutputAlias):
     A linked output alias will be translated to an object in the UI and stay linked to
     it.
     """
-    type: constr(regex='^DAGLinkedOutputAlias$') = 'DAGLinkedOutputAlias'
+    type: Literal['DAGLinkedOutputAlias'] = 'DAGLinkedOutputAlias'
 
 
 class _DAGArtifactOutputAlias(DAGGenericOutputAlias):
@@ -77,48 +76,57 @@ class _DAGArtifactOutputAlias(DAGGenericOutputAlias):
 
 class DAGFileOutputAlias(_DAGArtifactOutputAlias):
     """DAG alias file output."""
-    type: constr(regex='^DAGFileOutputAlias$') = 'DAGFileOutputAlias'
+    type: Literal['DAGFileOutputAlias'] = 'DAGFileOutputAlias'
 
     from_: Union[TaskReference, FileReference] = Field(
         ...,
         description='Reference to a file or a task output. Task output must be file.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGFolderOutputAlias(_DAGArtifactOutputAlias):
     """DAG alias folder output."""
-    type: constr(regex='^DAGFolderOutputAlias$') = 'DAGFolderOutputAlias'
+    type: Literal['DAGFolderOutputAlias'] = 'DAGFolderOutputAlias'
 
     from_: Union[TaskReference, FolderReference] = Field(
         ...,
         description='Reference to a folder or a task output. Task output must be folder.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGPathOutputAlias(_DAGArtifactOutputAlias):
     """DAG alias path output."""
-    type: constr(regex='^DAGPathOutputAlias$') = 'DAGPathOutputAlias'
+    type: Literal['DAGPathOutputAlias'] = 'DAGPathOutputAlias'
 
     from_: Union[TaskReference, FileReference, FolderReference] = Field(
         ...,
         description='Reference to a file, folder or a task output. Task output must '
         'either be a file or a folder.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGStringOutputAlias(DAGFileOutputAlias):
@@ -126,11 +134,9 @@ class DAGStringOutputAlias(DAGFileOutputAlias):
 
     This output loads the content from a file as a string.
     """
-    type: constr(regex='^DAGStringOutputAlias$') = 'DAGStringOutputAlias'
+    type: Literal['DAGStringOutputAlias'] = 'DAGStringOutputAlias'
 
-    @property
-    def is_artifact(self):
-        return False
+    is_artifact: ClassVar[bool] = False
 
 
 class DAGIntegerOutputAlias(DAGStringOutputAlias):
@@ -138,7 +144,7 @@ class DAGIntegerOutputAlias(DAGStringOutputAlias):
 
     This output loads the content from a file as an integer.
     """
-    type: constr(regex='^DAGIntegerOutputAlias$') = 'DAGIntegerOutputAlias'
+    type: Literal['DAGIntegerOutputAlias'] = 'DAGIntegerOutputAlias'
 
 
 class DAGNumberOutputAlias(DAGStringOutputAlias):
@@ -146,7 +152,7 @@ class DAGNumberOutputAlias(DAGStringOutputAlias):
 
     This output loads the content from a file as a floating number.
     """
-    type: constr(regex='^DAGNumberOutputAlias$') = 'DAGNumberOutputAlias'
+    type: Literal['DAGNumberOutputAlias'] = 'DAGNumberOutputAlias'
 
 
 class DAGBooleanOutputAlias(DAGStringOutputAlias):
@@ -154,7 +160,7 @@ class DAGBooleanOutputAlias(DAGStringOutputAlias):
 
     This output loads the content from a file as a boolean.
     """
-    type: constr(regex='^DAGBooleanOutputAlias$') = 'DAGBooleanOutputAlias'
+    type: Literal['DAGBooleanOutputAlias'] = 'DAGBooleanOutputAlias'
 
 
 class DAGArrayOutputAlias(DAGStringOutputAlias):
@@ -162,7 +168,7 @@ class DAGArrayOutputAlias(DAGStringOutputAlias):
 
     This output loads the content from a JSON file which must be a JSON Array.
     """
-    type: constr(regex='^DAGArrayOutputAlias$') = 'DAGArrayOutputAlias'
+    type: Literal['DAGArrayOutputAlias'] = 'DAGArrayOutputAlias'
 
     items_type: ItemType = Field(
         ItemType.String,
@@ -176,12 +182,15 @@ class DAGJSONObjectOutputAlias(DAGStringOutputAlias):
 
     This output loads the content from a file as a JSON object.
     """
-    type: constr(regex='^DAGJSONObjectOutputAlias$') = 'DAGJSONObjectOutputAlias'
+    type: Literal['DAGJSONObjectOutputAlias'] = 'DAGJSONObjectOutputAlias'
 
 
-DAGAliasOutputs = Union[
-    DAGGenericOutputAlias, DAGStringOutputAlias, DAGIntegerOutputAlias,
-    DAGNumberOutputAlias, DAGBooleanOutputAlias, DAGFolderOutputAlias,
-    DAGFileOutputAlias, DAGPathOutputAlias, DAGArrayOutputAlias,
-    DAGJSONObjectOutputAlias, DAGLinkedOutputAlias
+DAGAliasOutputs = Annotated[
+    Union[
+        DAGGenericOutputAlias, DAGStringOutputAlias, DAGIntegerOutputAlias,
+        DAGNumberOutputAlias, DAGBooleanOutputAlias, DAGFolderOutputAlias,
+        DAGFileOutputAlias, DAGPathOutputAlias, DAGArrayOutputAlias,
+        DAGJSONObjectOutputAlias, DAGLinkedOutputAlias
+    ],
+    Field(discriminator='type')
 ]
@@ -1,10 +1,11 @@
 """Queenbee output types for a DAG."""
 
-from typing import Union, List
+from typing import ClassVar, List, Union
 
-from pydantic import constr, Field, validator
+from pydantic import Field, validator
+from pydantic.typing import Annotated, Literal
 
-from ..common import ItemType, FromOutput
+from ..common import ItemType, FromOutput, default_type_tag
 from .alias import DAGAliasOutputs
 from ..reference import FileReference, FolderReference, TaskReference
 
@@ -16,16 +17,16 @@ class DAGGenericOutput(FromOutput):
     output that changes its type in different platforms because of returning different
     objects in handler.
     """
-    type: constr(regex='^DAGGenericOutput$') = 'DAGGenericOutput'
+    type: Literal['DAGGenericOutput'] = 'DAGGenericOutput'
 
     alias: List[DAGAliasOutputs] = Field(
-        None,
+        default_factory=list,
         description='A list of additional processes for loading this output on '
         'different platforms.'
     )
 
-    @validator('alias', always=True)
-    def create_empty_handler_list(cls, v):
+    @validator('alias', pre=True)
+    def create_empty_alias_list(cls, v):
         return [] if v is None else v
 
 
@@ -47,48 +48,57 @@ class _DAGArtifactOutput(DAGGenericOutput):
 
 class DAGFileOutput(_DAGArtifactOutput):
     """DAG file output."""
-    type: constr(regex='^DAGFileOutput$') = 'DAGFileOutput'
+    type: Literal['DAGFileOutput'] = 'DAGFileOutput'
 
     from_: Union[TaskReference, FileReference] = Field(
         ...,
         description='Reference to a file or a task output. Task output must be file.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGFolderOutput(_DAGArtifactOutput):
     """DAG folder output."""
-    type: constr(regex='^DAGFolderOutput$') = 'DAGFolderOutput'
+    type: Literal['DAGFolderOutput'] = 'DAGFolderOutput'
 
     from_: Union[TaskReference, FolderReference] = Field(
         ...,
         description='Reference to a folder or a task output. Task output must be folder.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGPathOutput(_DAGArtifactOutput):
     """DAG path output."""
-    type: constr(regex='^DAGPathOutput$') = 'DAGPathOutput'
+    type: Literal['DAGPathOutput'] = 'DAGPathOutput'
 
     from_: Union[TaskReference, FileReference, FolderReference] = Field(
         ...,
         description='Reference to a file, folder or a task output. Task output must '
         'either be a file or a folder.',
-        alias='from'
+        alias='from',
+        discriminator='type'
     )
 
-    @property
-    def is_artifact(self):
-        return True
+    @validator('from_', pre=True)
+    def default_from_type(cls, v, field):
+        return default_type_tag(v, field)
+
+    is_artifact: ClassVar[bool] = True
 
 
 class DAGStringOutput(DAGFileOutput):
@@ -96,11 +106,9 @@ class DAGStringOutput(DAGFileOutput):
 
     This output loads the content from a file as a string.
     """
-    type: constr(regex='^DAGStringOutput$') = 'DAGStringOutput'
+    type: Literal['DAGStringOutput'] = 'DAGStringOutput'
 
-    @property
-    def is_artifact(self):
-        return False
+    is_artifact: ClassVar[bool] = False
 
 
 class DAGIntegerOutput(DAGStringOutput):
@@ -108,7 +116,7 @@ class DAGIntegerOutput(DAGStringOutput):
 
     This output loads the content from a file as an integer.
     """
-    type: constr(regex='^DAGIntegerOutput$') = 'DAGIntegerOutput'
+    type: Literal['DAGIntegerOutput'] = 'DAGIntegerOutput'
 
 
 class DAGNumberOutput(DAGStringOutput):
@@ -116,7 +124,7 @@ class DAGNumberOutput(DAGStringOutput):
 
     This output loads the content from a file as a floating number.
     """
-    type: constr(regex='^DAGNumberOutput$') = 'DAGNumberOutput'
+    type: Literal['DAGNumberOutput'] = 'DAGNumberOutput'
 
 
 class DAGBooleanOutput(DAGStringOutput):
@@ -124,7 +132,7 @@ class DAGBooleanOutput(DAGStringOutput):
 
     This output loads the content from a file as a boolean.
     """
-    type: constr(regex='^DAGBooleanOutput$') = 'DAGBooleanOutput'
+    type: Literal['DAGBooleanOutput'] = 'DAGBooleanOutput'
 
 
 class DAGArrayOutput(DAGStringOutput):
@@ -132,7 +140,7 @@ class DAGArrayOutput(DAGStringOutput):
 
     This output loads the content from a JSON file which must be a JSON Array.
     """
-    type: constr(regex='^DAGArrayOutput$') = 'DAGArrayOutput'
+    type: Literal['DAGArrayOutput'] = 'DAGArrayOutput'
 
     items_type: ItemType = Field(
         ItemType.String,
@@ -146,11 +154,15 @@ class DAGJSONObjectOutput(DAGStringOutput):
 
     This output loads the content from a file as a JSON object.
     """
-    type: constr(regex='^DAGJSONObjectOutput$') = 'DAGJSONObjectOutput'
+    type: Literal['DAGJSONObjectOutput'] = 'DAGJSONObjectOutput'
 
 
-DAGOutputs = Union[
-    DAGGenericOutput, DAGStringOutput, DAGIntegerOutput, DAGNumberOutput,
-    DAGBooleanOutput, DAGFolderOutput, DAGFileOutput, DAGPathOutput, DAGArrayOutput,
-    DAGJSONObjectOutput
+DAGOutputs = Annotated[
+    Union[
+        DAGGenericOutput, DAGStringOutput, DAGIntegerOutput, DAGNumberOutput,
+        DAGBooleanOutput, DAGFolderOutput, DAGFileOutput, DAGPathOutput,
+        DAGArrayOutput, DAGJSONObjectOutput
+    ],
+    Field(discriminator='type')
 ]
+
@@ -3,15 +3,16 @@
 For more information on plugins see plugin module.
 """
 
-from typing import Union
-from pydantic import constr, Field
+from typing import ClassVar, Union
+from pydantic import Field
+from pydantic.typing import Annotated, Literal
 
 from ..common import PathOutput, ItemType
 
 
 class FunctionFileOutput(PathOutput):
     """Function File output."""
-    type: constr(regex='^FunctionFileOutput$') = 'FunctionFileOutput'
+    type: Literal['FunctionFileOutput'] = 'FunctionFileOutput'
 
     path: str = Field(
         ...,
@@ -19,14 +20,12 @@ class FunctionFileOutput(PathOutput):
         'is executed.'
         )
 
-    @property
-    def is_artifact(self):
-        return True
+    is_artifact: ClassVar[bool] = True
 
 
 class FunctionFolderOutput(PathOutput):
     """Function Folder output."""
-    type: constr(regex='^FunctionFolderOutput$') = 'FunctionFolderOutput'
+    type: Literal['FunctionFolderOutput'] = 'FunctionFolderOutput'
 
     path: str = Field(
         ...,
@@ -34,14 +33,12 @@ class FunctionFolderOutput(PathOutput):
         'is executed.'
         )
 
-    @property
-    def is_artifact(self):
-        return True
+    is_artifact: ClassVar[bool] = True
 
 
 class FunctionPathOutput(PathOutput):
     """Function Path output."""
-    type: constr(regex='^FunctionPathOutput$') = 'FunctionPathOutput'
+    type: Literal['FunctionPathOutput'] = 'FunctionPathOutput'
 
     path: str = Field(
         ...,
@@ -49,9 +46,7 @@ class FunctionPathOutput(PathOutput):
         'command is executed.'
         )
 
-    @property
-    def is_artifact(self):
-        return True
+    is_artifact: ClassVar[bool] = True
 
 
 class FunctionStringOutput(FunctionFileOutput):
@@ -59,11 +54,9 @@ class FunctionStringOutput(FunctionFileOutput):
 
     This output loads the content from a file as a string.
     """
-    type: constr(regex='^FunctionStringOutput$') = 'FunctionStringOutput'
+    type: Literal['FunctionStringOutput'] = 'FunctionStringOutput'
 
-    @property
-    def is_artifact(self):
-        return False
+    is_artifact: ClassVar[bool] = False
 
 
 class FunctionIntegerOutput(FunctionStringOutput):
@@ -71,7 +64,7 @@ class FunctionIntegerOutput(FunctionStringOutput):
 
     This output loads the content from a file as an integer.
     """
-    type: constr(regex='^FunctionIntegerOutput$') = 'FunctionIntegerOutput'
+    type: Literal['FunctionIntegerOutput'] = 'FunctionIntegerOutput'
 
 
 class FunctionNumberOutput(FunctionStringOutput):
@@ -79,7 +72,7 @@ class FunctionNumberOutput(FunctionStringOutput):
 
     This output loads the content from a file as a floating number.
     """
-    type: constr(regex='^FunctionNumberOutput$') = 'FunctionNumberOutput'
+    type: Literal['FunctionNumberOutput'] = 'FunctionNumberOutput'
 
 
 class FunctionBooleanOutput(FunctionStringOutput):
@@ -87,7 +80,7 @@ class FunctionBooleanOutput(FunctionStringOutput):
 
     This output loads the content from a file as a boolean.
     """
-    type: constr(regex='^FunctionBooleanOutput$') = 'FunctionBooleanOutput'
+    type: Literal['FunctionBooleanOutput'] = 'FunctionBooleanOutput'
 
 
 class FunctionArrayOutput(FunctionStringOutput):
@@ -95,7 +88,7 @@ class FunctionArrayOutput(FunctionStringOutput):
 
     This output loads the content from a JSON file which must be a JSON Array.
     """
-    type: constr(regex='^FunctionArrayOutput$') = 'FunctionArrayOutput'
+    type: Literal['FunctionArrayOutput'] = 'FunctionArrayOutput'
 
     items_type: ItemType = Field(
         ItemType.String,
@@ -109,11 +102,15 @@ class FunctionJSONObjectOutput(FunctionStringOutput):
 
     This output loads the content from a file as a JSON object.
     """
-    type: constr(regex='^FunctionJSONObjectOutput$') = 'FunctionJSONObjectOutput'
+    type: Literal['FunctionJSONObjectOutput'] = 'FunctionJSONObjectOutput'
 
 
-FunctionOutputs = Union[
-    FunctionStringOutput, FunctionIntegerOutput, FunctionNumberOutput,
-    FunctionBooleanOutput, FunctionFolderOutput, FunctionFileOutput, FunctionPathOutput,
-    FunctionArrayOutput, FunctionJSONObjectOutput
+FunctionOutputs = Annotated[
+    Union[
+        FunctionStringOutput, FunctionIntegerOutput, FunctionNumberOutput,
+        FunctionBooleanOutput, FunctionFolderOutput, FunctionFileOutput, FunctionPathOutput,
+        FunctionArrayOutput, FunctionJSONObjectOutput
+    ],
+    Field(discriminator='type')
 ]
+
@@ -5,7 +5,8 @@ For more information on plugins see plugin module.
 
 import json
 from typing import Union, List, Dict, Any
-from pydantic import constr, Field
+from pydantic import Field
+from pydantic.typing import Annotated, Literal
 
 from .function import FunctionStringOutput, FunctionIntegerOutput, \
     FunctionNumberOutput, FunctionBooleanOutput, FunctionFolderOutput, \
@@ -17,12 +18,13 @@ from .dag import DAGStringOutput, DAGIntegerOutput, DAGNumberOutput, \
     DAGArrayOutput, DAGJSONObjectOutput, DAGOutputs
 
 from ..artifact_source import HTTP, S3, ProjectFolder
+from ..common import construct_from_template
 
 
 class StepStringOutput(FunctionStringOutput):
     """A String output."""
 
-    type: constr(regex='^StepStringOutput$') = 'StepStringOutput'
+    type: Literal['StepStringOutput'] = 'StepStringOutput'
 
     value: str
 
@@ -30,7 +32,7 @@ class StepStringOutput(FunctionStringOutput):
 class StepIntegerOutput(FunctionIntegerOutput):
     """An integer output."""
 
-    type: constr(regex='^StepIntegerOutput$') = 'StepIntegerOutput'
+    type: Literal['StepIntegerOutput'] = 'StepIntegerOutput'
 
     value: int
 
@@ -38,7 +40,7 @@ class StepIntegerOutput(FunctionIntegerOutput):
 class StepNumberOutput(FunctionNumberOutput):
     """A number output."""
 
-    type: constr(regex='^StepNumberOutput$') = 'StepNumberOutput'
+    type: Literal['StepNumberOutput'] = 'StepNumberOutput'
 
     value: float
 
@@ -46,47 +48,50 @@ class StepNumberOutput(FunctionNumberOutput):
 class StepBooleanOutput(FunctionBooleanOutput):
     """The boolean type matches only two special values: True and False."""
 
-    type: constr(regex='^StepBooleanOutput$') = 'StepBooleanOutput'
+    type: Literal['StepBooleanOutput'] = 'StepBooleanOutput'
 
     value: bool
 
 
 class StepFolderOutput(FunctionFolderOutput):
     """A folder output."""
-    type: constr(regex='^StepFolderOutput$') = 'StepFolderOutput'
+    type: Literal['StepFolderOutput'] = 'StepFolderOutput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
 
 class StepFileOutput(FunctionFileOutput):
     """A file output."""
 
-    type: constr(regex='^StepFileOutput$') = 'StepFileOutput'
+    type: Literal['StepFileOutput'] = 'StepFileOutput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
 
 class StepPathOutput(FunctionPathOutput):
     """A file or a folder output."""
 
-    type: constr(regex='^StepPathOutput$') = 'StepPathOutput'
+    type: Literal['StepPathOutput'] = 'StepPathOutput'
 
     source: Union[HTTP, S3, ProjectFolder] = Field(
         ...,
-        description='The path to source the file from.'
+        description='The path to source the file from.',
+        discriminator='type'
     )
 
 
 class StepArrayOutput(FunctionArrayOutput):
     """A JSON array output."""
 
-    type: constr(regex='^StepArrayOutput$') = 'StepArrayOutput'
+    type: Literal['StepArrayOutput'] = 'StepArrayOutput'
 
     value: List
 
@@ -94,19 +99,47 @@ class StepArrayOutput(FunctionArrayOutput):
 class StepJSONObjectOutput(FunctionJSONObjectOutput):
     """A JSON object output."""
 
-    type: constr(regex='^StepJSONObjectOutput$') = 'StepJSONObjectOutput'
+    type: Literal['StepJSONObjectOutput'] = 'StepJSONObjectOutput'
 
     value: Dict
 
 
-StepOutputs = Union[
-    StepStringOutput, StepIntegerOutput, StepNumberOutput,
-    StepBooleanOutput, StepFolderOutput, StepFileOutput, StepPathOutput,
-    StepArrayOutput, StepJSONObjectOutput
+StepOutputs = Annotated[
+    Union[
+        StepStringOutput, StepIntegerOutput, StepNumberOutput,
+        StepBooleanOutput, StepFolderOutput, StepFileOutput, StepPathOutput,
+        StepArrayOutput, StepJSONObjectOutput
+    ],
+    Field(discriminator='type')
 ]
 
 
-def from_template(template: Union[DAGOutputs, FunctionOutputs], value: Any) -> StepOutputs:
+# step output class for each template output class
+_STEP_OUTPUT_CLASSES = {
+    DAGStringOutput: StepStringOutput,
+    FunctionStringOutput: StepStringOutput,
+    DAGIntegerOutput: StepIntegerOutput,
+    FunctionIntegerOutput: StepIntegerOutput,
+    DAGNumberOutput: StepNumberOutput,
+    FunctionNumberOutput: StepNumberOutput,
+    DAGBooleanOutput: StepBooleanOutput,
+    FunctionBooleanOutput: StepBooleanOutput,
+    DAGFolderOutput: StepFolderOutput,
+    FunctionFolderOutput: StepFolderOutput,
+    DAGFileOutput: StepFileOutput,
+    FunctionFileOutput: StepFileOutput,
+    DAGPathOutput: StepPathOutput,
+    FunctionPathOutput: StepPathOutput,
+    DAGArrayOutput: StepArrayOutput,
+    FunctionArrayOutput: StepArrayOutput,
+    DAGJSONObjectOutput: StepJSONObjectOutput,
+    FunctionJSONObjectOutput: StepJSONObjectOutput
+}
+
+
+def from_template(
+    template: Union[DAGOutputs, FunctionOutputs], value: Any, validate: bool = False
+) -> StepOutputs:
     """Generate a step output from a template output type and a value
 
     Args:
@@ -114,55 +147,48 @@ def from_template(template: Union[DAGOutputs, FunctionOutputs], value: Any) -> S
             template (DAG or Function)
         value {Any} -- The output value calculated for this template in
             the workflow step
+        validate {bool} -- Set to True to validate the fields that are copied from the
+            template. By default only the value is validated because the template
+            is already valid (default: False).
 
     Returns:
         StepOutputs -- A Step Output object
     """
 
-    template_dict = template.to_dict()
-    del template_dict['type']
-
+    step_class = _STEP_OUTPUT_CLASSES.get(template.__class__)
+    if step_class is None:
+        # not a DAG or function output
+        return None
+
+    if step_class is StepIntegerOutput:
+        value = int(float(value))
+    elif step_class is StepArrayOutput or step_class is StepJSONObjectOutput:
+        if isinstance(value, str):
+            value = json.loads(value)
+        if step_class is StepJSONObjectOutput and isinstance(value, list):
+            # a JSON array is accepted for a JSON object output and is returned as an
+            # array output. The fields of a JSON object output also apply to an array
+            # output and are validated against the array class.
+            step_class = StepArrayOutput
+            validate = True
+
+    values = {}
     if template.is_artifact:
-        template_dict['source'] = value
-        if 'path' not in template_dict:
+        values['source'] = value
+        if 'path' not in template.__fields__:
             # path is required for a step but is missing from a DAG output
-            template_dict['path'] = ''
-    elif template.is_parameter:
-        template_dict['value'] = value
-
-    if template.__class__ in [DAGStringOutput, FunctionStringOutput]:
-        return StepStringOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGIntegerOutput, FunctionIntegerOutput]:
-        template_dict['value'] = int(float(template_dict['value']))
-        return StepIntegerOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGNumberOutput, FunctionNumberOutput]:
-        return StepNumberOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGBooleanOutput, FunctionBooleanOutput]:
-        return StepBooleanOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGFolderOutput, FunctionFolderOutput]:
-        return StepFolderOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGFileOutput, FunctionFileOutput]:
-        return StepFileOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGPathOutput, FunctionPathOutput]:
-        return StepPathOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGArrayOutput, FunctionArrayOutput]:
-        if isinstance(template_dict['value'], str):
-            template_dict['value'] = json.loads(template_dict['value'])
-        return StepArrayOutput.parse_obj(template_dict)
-
-    if template.__class__ in [DAGJSONObjectOutput, FunctionJSONObjectOutput]:
-        if isinstance(template_dict['value'], str):
-            template_dict['value'] = json.loads(template_dict['value'])
-        try:
-            # Try to parse JSON as a dict
-            return StepJSONObjectOutput.parse_obj(template_dict)
-        except:
-            # Try to parse JSON as an array
-            return StepArrayOutput.parse_obj(template_dict)
+            values['path'] = ''
+    else:
+        values['value'] = value
+
+    if not validate:
+        return construct_from_template(step_class, template, **values)
+
+    # the template fields are copied as they are instead of serializing the template
+    template_dict = {
+        field.alias: getattr(template, name)
+        for name, field in template.__fields__.items() if name != 'type'
+    }
+    template_dict.update(values)
+
+    return step_class.parse_obj(template_dict)
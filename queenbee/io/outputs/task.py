@@ -10,8 +10,9 @@ Task argument and return objects provide the interface to connect:
 
 """
 
-from typing import Union
-from pydantic import constr
+from typing import ClassVar, Union
+from pydantic import Field
+from pydantic.typing import Annotated, Literal
 from ..common import GenericOutput, PathOutput
 
 
@@ -19,21 +20,17 @@ from ..common import GenericOutput, PathOutput
 class TaskReturn(GenericOutput):
     """A Task return output that exposes the values from a function or a DAG."""
 
-    type: constr(regex='^TaskReturn$') = 'TaskReturn'
+    type: Literal['TaskReturn'] = 'TaskReturn'
 
-    @property
-    def is_artifact(self):
-        return False
+    is_artifact: ClassVar[bool] = False
 
 
 class TaskPathReturn(PathOutput):
     """A Task output that returns a file or a folder output from a function or a DAG."""
 
-    type: constr(regex='^TaskPathReturn$') = 'TaskPathReturn'
+    type: Literal['TaskPathReturn'] = 'TaskPathReturn'
 
-    @property
-    def is_artifact(self):
-        return True
+    is_artifact: ClassVar[bool] = True
 
 
-TaskReturns = Union[TaskReturn, TaskPathReturn]
+TaskReturns = Annotated[Union[TaskReturn, TaskPathReturn], Field(discriminator='type')]
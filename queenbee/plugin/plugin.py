@@ -1,5 +1,4 @@
 """Queenbee Plugin class."""
-import json
 import os
 import yaml
 from typing import List
@@ -7,6 +6,7 @@ from pydantic import Field, validator, constr
 
 from ..base.basemodel import BaseModel
 from ..base.metadata import MetaData
+from ..base.parser import FullLoader
 from .function import Function
 
 
@@ -129,14 +129,14 @@ class Plugin(BaseModel):
         functions = []
 
         with open(meta_path, 'r') as f:
-            metadata = yaml.load(f, yaml.FullLoader)
+            metadata = yaml.load(f, FullLoader)
 
         with open(config_path, 'r') as f:
-            config = yaml.load(f, yaml.FullLoader)
+            config = yaml.load(f, FullLoader)
 
         for function in os.listdir(functions_path):
             with open(os.path.join(functions_path, function), 'r') as f:
-                functions.append(yaml.load(f, yaml.FullLoader))
+                functions.append(yaml.load(f, FullLoader))
 
         plugin['metadata'] = metadata
         plugin['config'] = config
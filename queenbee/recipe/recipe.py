@@ -13,6 +13,7 @@ from pydantic import Field, validator, root_validator, constr
 
 from ..base.basemodel import BaseModel
 from ..base.metadata import MetaData
+from ..base.parser import FullLoader
 
 from ..config import Config
 from ..plugin import Plugin
@@ -109,10 +110,10 @@ class Recipe(BaseModel):
         recipe = {}
 
         with open(meta_path, 'r') as f:
-            recipe['metadata'] = yaml.load(f, yaml.FullLoader)
+            recipe['metadata'] = yaml.load(f, FullLoader)
 
         with open(dependencies_path, 'r') as f:
-            dependencies = yaml.load(f, yaml.FullLoader)
+            dependencies = yaml.load(f, FullLoader)
 
         recipe.update(dependencies)
 
@@ -121,7 +122,7 @@ class Recipe(BaseModel):
         for dag_path in os.listdir(flow_path):
 
             with open(os.path.join(flow_path, dag_path), 'r') as f:
-                flow.append(yaml.load(f, yaml.FullLoader))
+                flow.append(yaml.load(f, FullLoader))
 
         recipe['flow'] = flow
 
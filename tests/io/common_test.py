@@ -0,0 +1,55 @@
+import os
+
+import pytest
+from jsonschema.exceptions import ValidationError as SpecValidationError
+from tests.base._base import BaseTestClass
+
+from queenbee.base.parser import parse_file
+from queenbee.io.common import compile_json_schema, json_schema_validator
+from queenbee.io.inputs.function import FunctionIntegerInput
+from queenbee.io.outputs.function import FunctionStringOutput
+from queenbee.plugin.function import Function
+
+
+class TestNestedIO(BaseTestClass):
+
+    klass = Function
+
+    asset_folder = 'tests/assets/functions'
+
+    def function_dict(self):
+        return parse_file(os.path.join(self.asset_folder, 'valid', 'minimum.yaml'))
+
+    def test_nested_io_is_not_copied(self):
+        inp = FunctionIntegerInput(name='count', default=1)
+        out = FunctionStringOutput(name='result', path='result.txt')
+        func = self.klass.parse_obj(
+            dict(self.function_dict(), inputs=[inp], outputs=[out])
+        )
+        assert func.inputs[0] is inp
+        assert func.outputs[0] is out
+
+        # the function shares the input with the caller
+        inp.default = 2
+        assert func.inputs[0].default == 2
+
+    def test_nested_io_copy(self):
+        inp = FunctionIntegerInput(name='count', default=1)
+        func = self.klass.parse_obj(dict(self.function_dict(), inputs=[inp.copy()]))
+        inp.default = 2
+        assert func.inputs[0].default == 1
+
+
+class TestCompileJSONSchema:
+
+    def test_cached(self):
+        assert compile_json_schema({'minimum': 0}) is \
+            compile_json_schema({'minimum': 0})
+
+    def test_not_serializable(self):
+        # keys of different types cannot be sorted for the cache key
+        spec = {'minimum': 0, 1: 'one'}
+        assert compile_json_schema(spec).schema is spec
+        json_schema_validator(1, spec)
+        with pytest.raises(SpecValidationError):
+            json_schema_validator(-1, spec)
@@ -0,0 +1,102 @@
+import os
+
+import pytest
+from jsonschema.exceptions import ValidationError as SpecValidationError
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+
+from queenbee.io.inputs.alias import DAGArrayInputAlias, DAGFileInputAlias, \
+    DAGPathInputAlias
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class TestDAGArrayInputAliasIO(BaseIOTest):
+
+    klass = DAGArrayInputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGArrayInputAlias')
+
+
+class TestDAGArrayInputAlias(BaseTestClass):
+
+    klass = DAGArrayInputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGArrayInputAlias')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'values.yaml')
+        )
+
+    def test_validate_spec_edited_spec(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec([1, 2]) == [1, 2]
+
+        copied = inp.copy(update={'spec': {'maxItems': 1}})
+        with pytest.raises(SpecValidationError):
+            copied.validate_spec([1, 2])
+
+        inp.spec['maxItems'] = 1
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([1, 2])
+
+    def test_validate_spec_items(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec([1, 2]) == [1, 2]
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([1, 2, 3, 4])
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(['1'])
+
+    def test_validate_spec_user_items(self):
+        inp = self.valid_instance().copy(update={'spec': {'items': {'minimum': 0}}})
+        assert inp.validate_spec([0, 2]) == [0, 2]
+
+        # both the items in spec and the item type are enforced
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([-5])
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(['1'])
+
+
+class TestDAGFileInputAlias(BaseTestClass):
+
+    klass = DAGFileInputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGFileInputAlias')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'weather.yaml')
+        )
+
+    def test_validate_spec_extensions(self, tmp_path):
+        fp = tmp_path / 'weather.EPW'
+        fp.write_text('')
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+        inp.extensions = ['hbjson']
+        with pytest.raises(AssertionError):
+            inp.validate_spec(str(fp))
+
+        inp.extensions = None
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+
+class TestDAGPathInputAlias(TestDAGFileInputAlias):
+
+    klass = DAGPathInputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGPathInputAlias')
+
+    def test_validate_spec_folder(self, tmp_path):
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(tmp_path)) == str(tmp_path)
+
+        with pytest.raises(ValueError):
+            inp.validate_spec(str(tmp_path / 'not-a-file.epw'))
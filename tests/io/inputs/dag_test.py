@@ -0,0 +1,204 @@
+import os
+from typing import List
+
+import pytest
+from jsonschema.exceptions import ValidationError as SpecValidationError
+from pydantic import ValidationError
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+from tests.base.value_error import BaseValueErrorTest
+
+from queenbee.base.basemodel import BaseModel
+from queenbee.base.parser import parse_file
+from queenbee.io.common import ItemType
+from queenbee.io.inputs.dag import DAGArrayInput, DAGFileInput, DAGInputs, \
+    DAGIntegerInput, DAGPathInput, DAGStringInput
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class DAGInputsList(BaseModel):
+    inputs: List[DAGInputs]
+
+
+class TestDAGIntegerInputIO(BaseIOTest):
+
+    klass = DAGIntegerInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGIntegerInput')
+
+
+class TestDAGIntegerInputValueError(BaseValueErrorTest):
+
+    klass = DAGIntegerInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGIntegerInput')
+
+
+class TestDAGIntegerInput(BaseTestClass):
+
+    klass = DAGIntegerInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGIntegerInput')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'count.yaml')
+        )
+
+    def test_validate_spec_type(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec(3) == 3
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(-1)
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec('3')
+
+    def test_compile_spec(self):
+        inp = self.valid_instance()
+        validator = inp.compile_spec()
+        assert validator.schema == {'minimum': 0, 'type': 'integer'}
+        assert 'type' not in inp.spec
+
+        assert self.klass(name='count', default=1).compile_spec() is None
+
+    def test_validate_spec_reassigned_spec(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec(3) == 3
+
+        inp.spec = {'maximum': 2}
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(3)
+
+    def test_validate_spec_copied_spec(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec(3) == 3
+
+        copied = inp.copy(update={'spec': {'maximum': 2}})
+        with pytest.raises(SpecValidationError):
+            copied.validate_spec(3)
+        assert inp.validate_spec(3) == 3
+
+    def test_validate_spec_edited_spec(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec(3) == 3
+
+        inp.spec['maximum'] = 2
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(3)
+
+
+class TestDAGArrayInputIO(BaseIOTest):
+
+    klass = DAGArrayInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGArrayInput')
+
+
+class TestDAGArrayInput(BaseTestClass):
+
+    klass = DAGArrayInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGArrayInput')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'values.yaml')
+        )
+
+    def test_validate_spec_items(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec([1, 2]) == [1, 2]
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([1, 2, 3, 4])
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(['1'])
+
+    def test_validate_spec_user_items(self):
+        inp = self.valid_instance().copy(update={'spec': {'items': {'minimum': 0}}})
+        assert inp.validate_spec([0, 2]) == [0, 2]
+
+        # both the items in spec and the item type are enforced
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([-5])
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(['1'])
+
+    def test_empty_default(self):
+        inp = self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'no_default.yaml')
+        )
+        assert inp.default == []
+        assert self.klass.parse_obj(inp.to_dict()) == inp
+        assert self.klass(name='values', default=None) == inp
+
+    def test_validate_spec_generic_items(self):
+        inp = self.valid_instance().copy(update={'items_type': ItemType.Generic})
+        assert inp.validate_spec([1, 'a']) == [1, 'a']
+
+
+class TestDAGFileInput(BaseTestClass):
+
+    klass = DAGFileInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGFileInput')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'weather.yaml')
+        )
+
+    def test_validate_spec_extensions(self, tmp_path):
+        fp = tmp_path / 'weather.EPW'
+        fp.write_text('')
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+        inp.extensions = ['hbjson']
+        with pytest.raises(AssertionError):
+            inp.validate_spec(str(fp))
+
+        inp.extensions = None
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+
+class TestDAGPathInput(TestDAGFileInput):
+
+    klass = DAGPathInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGPathInput')
+
+    def test_validate_spec_folder(self, tmp_path):
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(tmp_path)) == str(tmp_path)
+
+        with pytest.raises(ValueError):
+            inp.validate_spec(str(tmp_path / 'not-a-file.epw'))
+
+
+class TestDAGInputs(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGInputs')
+
+    def load(self, path):
+        data = parse_file(os.path.join(self.asset_folder, path))
+        return DAGInputsList.parse_obj({'inputs': data}).inputs
+
+    def test_dispatch_on_type(self):
+        inputs = self.load('valid/inputs.yaml')
+        assert [type(inp) for inp in inputs] == [DAGIntegerInput, DAGStringInput]
+
+    def test_load_invalid_default(self):
+        with pytest.raises(ValidationError) as error:
+            self.load('invalid/invalid_default.yaml')
+        # only the class for the type of the input is used to parse it
+        assert all(e['loc'][2] == 'DAGIntegerInput' for e in error.value.errors())
+
+    def test_load_unknown_type(self):
+        with pytest.raises(ValidationError, match='No match for discriminator'):
+            self.load('invalid/unknown_type.yaml')
@@ -0,0 +1,79 @@
+import os
+
+import pytest
+from jsonschema.exceptions import ValidationError as SpecValidationError
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+
+from queenbee.io.inputs.function import FunctionArrayInput, FunctionFileInput, \
+    FunctionPathInput
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class TestFunctionArrayInputIO(BaseIOTest):
+
+    klass = FunctionArrayInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'FunctionArrayInput')
+
+
+class TestFunctionArrayInput(BaseTestClass):
+
+    klass = FunctionArrayInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'FunctionArrayInput')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'values.yaml')
+        )
+
+    def test_validate_spec_items(self):
+        inp = self.valid_instance()
+        assert inp.validate_spec([1, 2]) == [1, 2]
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec([1, 2, 3, 4])
+
+        with pytest.raises(SpecValidationError):
+            inp.validate_spec(['1'])
+
+
+class TestFunctionFileInput(BaseTestClass):
+
+    klass = FunctionFileInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'FunctionFileInput')
+
+    def valid_instance(self):
+        return self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'weather.yaml')
+        )
+
+    def test_validate_spec_extensions(self, tmp_path):
+        fp = tmp_path / 'weather.EPW'
+        fp.write_text('')
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+        inp.extensions = ['hbjson']
+        with pytest.raises(AssertionError):
+            inp.validate_spec(str(fp))
+
+        inp.extensions = None
+        assert inp.validate_spec(str(fp)) == str(fp)
+
+
+class TestFunctionPathInput(TestFunctionFileInput):
+
+    klass = FunctionPathInput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'FunctionPathInput')
+
+    def test_validate_spec_folder(self, tmp_path):
+        inp = self.valid_instance()
+        assert inp.validate_spec(str(tmp_path)) == str(tmp_path)
+
+        with pytest.raises(ValueError):
+            inp.validate_spec(str(tmp_path / 'not-a-file.epw'))
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+from tests.base.value_error import BaseValueErrorTest
+
+from queenbee.io.artifact_source import S3, ProjectFolder
+from queenbee.io.inputs.job import JobArgument, JobPathArgument, \
+    load_job_arguments, load_job_arguments_from_dict
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class TestJobPathArgumentIO(BaseIOTest):
+
+    klass = JobPathArgument
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'JobPathArgument')
+
+
+class TestJobPathArgumentValueError(BaseValueErrorTest):
+
+    klass = JobPathArgument
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'JobPathArgument')
+
+
+class TestJobPathArgument(BaseTestClass):
+
+    klass = JobPathArgument
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'JobPathArgument')
+
+    def test_source_dispatch_on_type(self):
+        arg = self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 's3_source.yaml')
+        )
+        assert isinstance(arg.source, S3)
+
+    def test_source_without_type(self):
+        # like the union before it was discriminated the first source that can parse
+        # the value is used
+        arg = self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'source_without_type.yaml')
+        )
+        assert isinstance(arg.source, ProjectFolder)
+        assert arg.source.path == 'model.hbjson'
+
+
+class TestLoadJobArguments(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'JobArguments')
+
+    def test_load_job_arguments(self):
+        args = load_job_arguments(
+            os.path.join(self.asset_folder, 'valid', 'arguments.yaml')
+        )
+        assert [type(arg) for arg in args] == [JobArgument, JobPathArgument]
+
+    def test_load_trusted_job_arguments(self):
+        # trusted arguments must be written from valid arguments
+        args = load_job_arguments(
+            os.path.join(self.asset_folder, 'valid', 'arguments.yaml')
+        )
+        data = [arg.to_dict() for arg in args]
+        assert load_job_arguments_from_dict(data, trusted=True) == args
+
+    def test_load_invalid_type(self):
+        with pytest.raises(ValueError, match='Invalid type'):
+            load_job_arguments(
+                os.path.join(self.asset_folder, 'invalid', 'unknown_type.yaml')
+            )
@@ -0,0 +1,110 @@
+import os
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+from tests.base._base import BaseTestClass
+
+from queenbee.base.basemodel import BaseModel
+from queenbee.base.parser import parse_file
+from queenbee.io.inputs.dag import DAGIntegerInput, DAGJSONObjectInput, DAGStringInput
+from queenbee.io.inputs.function import FunctionArrayInput, FunctionFileInput
+from queenbee.io.inputs.step import StepArrayInput, StepFileInput, StepInputs, \
+    StepIntegerInput, StepJSONObjectInput, StepStringInput, from_template
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class StepInputsList(BaseModel):
+    inputs: List[StepInputs]
+
+
+class TestStepInputs(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'StepInputs')
+
+    def test_dispatch_on_type(self):
+        data = parse_file(os.path.join(self.asset_folder, 'valid', 'inputs.yaml'))
+        inputs = StepInputsList.parse_obj({'inputs': data}).inputs
+        assert [type(inp) for inp in inputs] == [StepStringInput, StepIntegerInput]
+
+
+class TestFromTemplate(BaseTestClass):
+
+    templates = [
+        (DAGStringInput(name='label', default='a'), 'b'),
+        (DAGIntegerInput(name='count', default=1), '3.0'),
+        (FunctionArrayInput(name='values'), '[1, 2]'),
+        (DAGJSONObjectInput(name='config'), {'a': 1}),
+        (
+            FunctionFileInput(name='model', path='model.hbjson'),
+            {'type': 'ProjectFolder', 'path': 'project/model.hbjson'}
+        )
+    ]
+
+    def test_parameter_inputs(self):
+        step_input = from_template(DAGStringInput(name='label', default='a'), 'b')
+        assert isinstance(step_input, StepStringInput)
+        assert step_input.value == 'b'
+
+        step_input = from_template(DAGIntegerInput(name='count', default=1), '3.0')
+        assert isinstance(step_input, StepIntegerInput)
+        assert step_input.value == 3
+
+        step_input = from_template(FunctionArrayInput(name='values'), '[1, 2]')
+        assert isinstance(step_input, StepArrayInput)
+        assert step_input.value == [1, 2]
+
+        step_input = from_template(DAGJSONObjectInput(name='config'), '{"a": 1}')
+        assert isinstance(step_input, StepJSONObjectInput)
+        assert step_input.value == {'a': 1}
+
+    def test_artifact_input(self):
+        template = FunctionFileInput(name='model', path='model.hbjson')
+        step_input = from_template(
+            template, {'type': 'ProjectFolder', 'path': 'project/model.hbjson'}
+        )
+        assert isinstance(step_input, StepFileInput)
+        assert step_input.source.path == 'project/model.hbjson'
+        assert step_input.path == 'model.hbjson'
+
+    def test_artifact_input_source_without_type(self):
+        template = FunctionFileInput(name='model', path='model.hbjson')
+        step_input = from_template(template, {'path': 'project/model.hbjson'})
+        assert step_input.source.type == 'ProjectFolder'
+
+        step_input = from_template(template, {'url': 'https://example.com/model'})
+        assert step_input.source.type == 'HTTP'
+
+    def test_template_not_shared(self):
+        template = FunctionArrayInput(
+            name='values', default=[1], spec={'items': {'minimum': 0}}
+        )
+        step_input = from_template(template, '[1, 2]')
+        step_input.default.append(2)
+        step_input.spec['items']['minimum'] = 1
+        assert template.default == [1]
+        assert template.spec == {'items': {'minimum': 0}}
+
+    def test_validate(self):
+        for template, value in self.templates:
+            assert from_template(template, value).to_dict() == \
+                from_template(template, value, validate=True).to_dict()
+
+    def test_invalid_value(self):
+        with pytest.raises(ValidationError):
+            from_template(DAGStringInput(name='label', default='a'), ['b'])
+
+        with pytest.raises(ValidationError):
+            from_template(FunctionFileInput(name='model', path='model.hbjson'), 'model')
+
+    def test_json_object_input_array(self):
+        template = DAGJSONObjectInput(
+            name='config', default={'a': 1}, spec={'required': ['a']}
+        )
+        step_input = from_template(template, '[1, 2]')
+        assert isinstance(step_input, StepArrayInput)
+        assert step_input.value == [1, 2]
+        assert step_input.name == 'config'
+        assert step_input.default == []
+        assert step_input.spec is None
@@ -0,0 +1,45 @@
+import os
+
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+from tests.base.value_error import BaseValueErrorTest
+
+from queenbee.io.outputs.alias import DAGGenericOutputAlias, DAGPathOutputAlias
+from queenbee.io.reference import FileReference
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class TestDAGGenericOutputAliasIO(BaseIOTest):
+
+    klass = DAGGenericOutputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGGenericOutputAlias')
+
+
+class TestDAGGenericOutputAliasValueError(BaseValueErrorTest):
+
+    klass = DAGGenericOutputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGGenericOutputAlias')
+
+
+class TestDAGPathOutputAliasIO(BaseIOTest):
+
+    klass = DAGPathOutputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGPathOutputAlias')
+
+
+class TestDAGPathOutputAlias(BaseTestClass):
+
+    klass = DAGPathOutputAlias
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGPathOutputAlias')
+
+    def test_from_without_type(self):
+        out = self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'from_without_type.yaml')
+        )
+        assert isinstance(out.from_, FileReference)
+        assert out.from_.path == 'results'
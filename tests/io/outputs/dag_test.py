@@ -0,0 +1,57 @@
+import os
+from typing import List
+
+from tests.base._base import BaseTestClass
+from tests.base.io_test import BaseIOTest
+
+from queenbee.base.basemodel import BaseModel
+from queenbee.base.parser import parse_file
+from queenbee.io.outputs.dag import DAGFileOutput, DAGIntegerOutput, DAGOutputs
+from queenbee.io.reference import TaskReference
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class DAGOutputsList(BaseModel):
+    outputs: List[DAGOutputs]
+
+
+class TestDAGFileOutputIO(BaseIOTest):
+
+    klass = DAGFileOutput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGFileOutput')
+
+
+class TestDAGFileOutput(BaseTestClass):
+
+    klass = DAGFileOutput
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGFileOutput')
+
+    def test_from_without_type(self):
+        # like the union before it was discriminated the first reference that can
+        # parse the value is used
+        out = self.klass.from_file(
+            os.path.join(self.asset_folder, 'valid', 'from_without_type.yaml')
+        )
+        assert isinstance(out.from_, TaskReference)
+        assert out.from_.variable == 'model'
+
+
+class TestDAGOutputs(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'DAGOutputs')
+
+    def load(self, path):
+        data = parse_file(os.path.join(self.asset_folder, path))
+        return DAGOutputsList.parse_obj({'outputs': data}).outputs
+
+    def test_dispatch_on_type(self):
+        outputs = self.load('valid/outputs.yaml')
+        assert [type(out) for out in outputs] == [DAGIntegerOutput, DAGFileOutput]
+
+    def test_is_artifact(self):
+        outputs = self.load('valid/outputs.yaml')
+        assert [out.is_artifact for out in outputs] == [False, True]
+        assert 'is_artifact' not in outputs[1].to_dict()
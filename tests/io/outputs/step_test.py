@@ -0,0 +1,42 @@
+import os
+from typing import List
+
+from tests.base._base import BaseTestClass
+
+from queenbee.base.basemodel import BaseModel
+from queenbee.base.parser import parse_file
+from queenbee.io.outputs.function import FunctionJSONObjectOutput, FunctionStringOutput
+from queenbee.io.outputs.step import StepArrayOutput, StepFileOutput, StepIntegerOutput, \
+    StepOutputs, StepStringOutput, from_template
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class StepOutputsList(BaseModel):
+    outputs: List[StepOutputs]
+
+
+class TestStepOutputs(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'StepOutputs')
+
+    def test_dispatch_on_type(self):
+        data = parse_file(os.path.join(self.asset_folder, 'valid', 'outputs.yaml'))
+        outputs = StepOutputsList.parse_obj({'outputs': data}).outputs
+        assert [type(out) for out in outputs] == [StepIntegerOutput, StepFileOutput]
+
+
+class TestFromTemplate(BaseTestClass):
+
+    def test_parameter_output(self):
+        template = FunctionStringOutput(name='result', path='result.txt')
+        step_output = from_template(template, 'done')
+        assert isinstance(step_output, StepStringOutput)
+        assert step_output.value == 'done'
+
+    def test_json_object_output_array(self):
+        template = FunctionJSONObjectOutput(name='config', path='config.json')
+        step_output = from_template(template, '[1, 2]')
+        assert isinstance(step_output, StepArrayOutput)
+        assert step_output.value == [1, 2]
+        assert step_output.path == 'config.json'
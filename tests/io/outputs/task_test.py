@@ -0,0 +1,24 @@
+import os
+from typing import List
+
+from tests.base._base import BaseTestClass
+
+from queenbee.base.basemodel import BaseModel
+from queenbee.base.parser import parse_file
+from queenbee.io.outputs.task import TaskPathReturn, TaskReturn, TaskReturns
+
+ASSET_FOLDER = 'tests/assets/io'
+
+
+class TaskReturnsList(BaseModel):
+    returns: List[TaskReturns]
+
+
+class TestTaskReturns(BaseTestClass):
+
+    asset_folder = os.path.join(ASSET_FOLDER, 'TaskReturns')
+
+    def test_dispatch_on_type(self):
+        data = parse_file(os.path.join(self.asset_folder, 'valid', 'returns.yaml'))
+        returns = TaskReturnsList.parse_obj({'returns': data}).returns
+        assert [type(ret) for ret in returns] == [TaskReturn, TaskPathReturn]